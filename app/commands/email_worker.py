@@ -0,0 +1,22 @@
+import asyncio
+
+from app.db.session import engine
+from app.services import email_outbox
+
+
+async def _run() -> None:
+    try:
+        await email_outbox.run_worker()
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    try:
+        asyncio.run(_run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
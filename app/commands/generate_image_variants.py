@@ -0,0 +1,47 @@
+import argparse
+import asyncio
+
+from app.db.session import SessionLocal, engine
+from app.repositories import blog_repo
+from app.services import blog_service, image_variants
+
+
+async def _backfill(force: bool) -> tuple[int, int]:
+    if not image_variants.available():
+        raise SystemExit("Image variants need Pillow (install the `images` extra) and IMAGE_VARIANTS_ENABLED=true.")
+    try:
+        async with SessionLocal() as db:
+            image_urls = await blog_repo.local_image_urls(
+                db,
+                image_variants.MEDIA_PREFIX,
+                missing_variants_only=not force,
+            )
+            image_urls = sorted(image_urls)
+            results = await asyncio.gather(
+                *(image_variants.generate(url) for url in image_urls),
+                return_exceptions=True,
+            )
+            processed = updated = 0
+            for url, variants in zip(image_urls, results):
+                if isinstance(variants, Exception):
+                    print(f"Failed {url}: {variants}")
+                    continue
+                if variants:
+                    processed += 1
+                    updated += await blog_service.record_image_variants(db, url, variants)
+            return processed, updated
+    finally:
+        image_variants.shutdown_pool()
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate responsive variants for blog images in MEDIA_DIR/blogs.")
+    parser.add_argument("--force", action="store_true", help="regenerate images that already have variants")
+    args = parser.parse_args()
+    processed, updated = asyncio.run(_backfill(args.force))
+    print(f"Generated variants for {processed} images across {updated} blogs.")
+
+
+if __name__ == "__main__":
+    main()
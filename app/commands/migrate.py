@@ -0,0 +1,119 @@
+import argparse
+import asyncio
+
+from alembic import command
+from sqlalchemy import Connection, inspect, select, text, update
+
+from app.db.base import Base
+from app.db.models.blog import Blog
+from app.db.models.email_log import EmailLog
+from app.db.schema import BASELINE_REVISION, alembic_config
+from app.db.session import SessionLocal, engine
+from app.repositories import category_repo
+from app.services import search_service
+
+
+def _drop_excerpt_column_if_present(conn: Connection) -> None:
+    columns = {column["name"] for column in inspect(conn).get_columns("blogs")}
+    if "excerpt_html" not in columns:
+        return
+    if conn.dialect.name != "postgresql":
+        return
+    conn.execute(text("ALTER TABLE blogs DROP COLUMN IF EXISTS excerpt_html"))
+
+
+def _add_published_posts_count_column_if_missing(conn: Connection) -> bool:
+    columns = {column["name"] for column in inspect(conn).get_columns("categories")}
+    if "published_posts_count" in columns:
+        return False
+    conn.execute(text("ALTER TABLE categories ADD COLUMN published_posts_count INTEGER NOT NULL DEFAULT 0"))
+    return True
+
+
+def _add_email_outbox_columns_if_missing(conn: Connection) -> None:
+    columns = {column["name"] for column in inspect(conn).get_columns("email_logs")}
+    ddl = {
+        "html_body": "TEXT",
+        "cc_emails": "JSON",
+        "attempts": "INTEGER NOT NULL DEFAULT 0",
+        "next_attempt_at": "TIMESTAMP WITH TIME ZONE",
+    }
+    for name, column_type in ddl.items():
+        if name not in columns:
+            conn.execute(text(f"ALTER TABLE email_logs ADD COLUMN {name} {column_type}"))
+
+
+def _add_blog_image_variants_column_if_missing(conn: Connection) -> None:
+    columns = {column["name"] for column in inspect(conn).get_columns("blogs")}
+    if "image_variants" not in columns:
+        conn.execute(text("ALTER TABLE blogs ADD COLUMN image_variants JSON"))
+
+
+def _add_blog_search_vector_column_if_missing(conn: Connection) -> None:
+    columns = {column["name"] for column in inspect(conn).get_columns("blogs")}
+    if "search_vector" not in columns:
+        column_type = "TSVECTOR" if conn.dialect.name == "postgresql" else "TEXT"
+        conn.execute(text(f"ALTER TABLE blogs ADD COLUMN search_vector {column_type}"))
+    rows = conn.execute(
+        select(Blog.id, Blog.title, Blog.content_html).where(Blog.search_vector.is_(None))
+    ).all()
+    for blog_id, title, content_html in rows:
+        conn.execute(
+            update(Blog)
+            .where(Blog.id == blog_id)
+            .values(
+                search_vector=search_service.search_vector(conn.dialect.name, title, content_html),
+                updated_at=Blog.updated_at,
+            )
+        )
+
+
+def _ensure_indexes(conn: Connection) -> None:
+    for model in (Blog, EmailLog):
+        for index in model.__table__.indexes:
+            index.create(bind=conn, checkfirst=True)
+
+
+def _upgrade_legacy_schema(conn: Connection) -> bool:
+    Base.metadata.create_all(conn)
+    _drop_excerpt_column_if_present(conn)
+    _add_email_outbox_columns_if_missing(conn)
+    _add_blog_image_variants_column_if_missing(conn)
+    _add_blog_search_vector_column_if_missing(conn)
+    _ensure_indexes(conn)
+    return _add_published_posts_count_column_if_missing(conn)
+
+
+def _migrate(conn: Connection, revision: str) -> bool:
+    config = alembic_config()
+    config.attributes["connection"] = conn
+    table_names = set(inspect(conn).get_table_names())
+    counts_added = False
+    if "alembic_version" not in table_names and "blogs" in table_names:
+        counts_added = _upgrade_legacy_schema(conn)
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, revision)
+    return counts_added
+
+
+async def _run(revision: str) -> None:
+    try:
+        async with engine.begin() as conn:
+            counts_added = await conn.run_sync(_migrate, revision)
+        if counts_added:
+            async with SessionLocal() as db:
+                await category_repo.reconcile_post_counts(db)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply database migrations.")
+    parser.add_argument("revision", nargs="?", default="head")
+    args = parser.parse_args()
+    asyncio.run(_run(args.revision))
+    print(f"Database migrated to {args.revision}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+import asyncio
+
+from app.db.session import SessionLocal, engine
+from app.repositories import category_repo
+
+
+async def _reconcile() -> int:
+    try:
+        async with SessionLocal() as db:
+            return await category_repo.reconcile_post_counts(db)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    updated = asyncio.run(_reconcile())
+    print(f"Reconciled post counts for {updated} categories.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+from app.core.config import settings
+from app.core.singleflight import SingleFlight
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class TTLCache:
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generations: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _namespace(key: Hashable) -> Hashable:
+        return key[0] if isinstance(key, tuple) and key else key
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            if generation is not None and generation != self._generations.get(self._namespace(key), 0):
+                return
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def generation(self, key: Hashable) -> int:
+        with self._lock:
+            return self._generations.get(self._namespace(key), 0)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        return await self._flights.do(key, lambda: self._load(key, loader))
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+        generation = self.generation(key)
+        value = await loader()
+        if value is not None:
+            self.set(key, value, generation=generation)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._bump(self._namespace(key))
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def invalidate_namespace(self, namespace: Hashable) -> None:
+        with self._lock:
+            self._bump(namespace)
+            stale = [key for key in self._entries if self._namespace(key) == namespace]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def _bump(self, namespace: Hashable) -> None:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for namespace in {self._namespace(key) for key in self._entries}:
+                self._bump(namespace)
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "loads": self._flights.leaders,
+                "coalesced_loads": self._flights.coalesced,
+                "loads_in_flight": self._flights.in_flight(),
+            }
+
+
+public_cache = TTLCache(
+    max_entries=settings.PUBLIC_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PUBLIC_CACHE_TTL_SECONDS,
+)
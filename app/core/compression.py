@@ -0,0 +1,233 @@
+import zlib
+from collections import Counter
+from collections.abc import Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+_COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/problem+json",
+    "image/svg+xml",
+}
+
+
+class _GzipEncoder:
+    def __init__(self) -> None:
+        self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self) -> None:
+        self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self) -> None:
+        if hasattr(zstd, "ZstdCompressor") and hasattr(zstd.ZstdCompressor, "compressobj"):
+            self._compressor = zstd.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compressobj()
+            self._flush_block = zstd.COMPRESSOBJ_FLUSH_BLOCK
+            self._finish = lambda: self._compressor.flush()
+        else:
+            self._compressor = zstd.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL)
+            self._flush_block = zstd.ZstdCompressor.FLUSH_BLOCK
+            self._finish = lambda: self._compressor.flush(zstd.ZstdCompressor.FLUSH_FRAME)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(self._flush_block)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+ENCODERS: dict[str, Callable[[], _GzipEncoder | _BrotliEncoder | _ZstdEncoder]] = {}
+if brotli is not None:
+    ENCODERS["br"] = _BrotliEncoder
+if zstd is not None:
+    ENCODERS["zstd"] = _ZstdEncoder
+ENCODERS["gzip"] = _GzipEncoder
+
+
+def select_encoding(accept_encoding: str) -> str | None:
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        weights[coding] = quality
+    best, best_quality = None, 0.0
+    for coding in ENCODERS:
+        quality = weights.get(coding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def _is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in _COMPRESSIBLE_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+compressed_cache = TTLCache(
+    max_entries=settings.COMPRESSION_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.COMPRESSION_CACHE_TTL_SECONDS,
+)
+compression_counts: Counter[str] = Counter()
+
+
+def stats() -> dict:
+    return {
+        "encodings": list(ENCODERS),
+        "minimum_size": settings.COMPRESSION_MINIMUM_SIZE,
+        "responses": dict(compression_counts),
+        "cache": compressed_cache.stats(),
+    }
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int, exclude_prefixes: tuple[str, ...] = ()) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.exclude_prefixes = exclude_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_prefixes):
+            await self.app(scope, receive, send)
+            return
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressedResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.scope: Scope
+        self.send: Send
+        self.start_message: Message | None = None
+        self.passthrough = False
+        self.encoder: _GzipEncoder | _BrotliEncoder | _ZstdEncoder | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.scope = scope
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    def _cache_key(self, headers: MutableHeaders) -> tuple | None:
+        etag = headers.get("etag")
+        cache_control = headers.get("cache-control", "")
+        if (
+            not etag
+            or etag.startswith("W/")
+            or self.scope["method"] != "GET"
+            or "set-cookie" in headers
+            or "private" in cache_control
+            or "no-store" in cache_control
+        ):
+            return None
+        return (self.encoding, self.scope["path"], self.scope.get("query_string", b""), etag)
+
+    def _should_compress(self, status: int, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        return (
+            status == 200
+            and "content-encoding" not in headers
+            and _is_compressible(headers.get("content-type", ""))
+            and (more_body or len(body) >= self.minimum_size)
+        )
+
+    async def send_compressed(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+            return
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            headers = MutableHeaders(raw=start["headers"])
+            if not self._should_compress(start["status"], headers, body, more_body):
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+
+            cache_key = None if more_body else self._cache_key(headers)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            compression_counts[self.encoding] += 1
+
+            if not more_body:
+                compressed = compressed_cache.get(cache_key) if cache_key else None
+                if compressed is None:
+                    encoder = ENCODERS[self.encoding]()
+                    compressed = encoder.compress(body) + encoder.finish()
+                    if cache_key:
+                        compressed_cache.set(cache_key, compressed)
+                headers["Content-Length"] = str(len(compressed))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+            del headers["Content-Length"]
+            self.encoder = ENCODERS[self.encoding]()
+            await self.send(start)
+
+        chunk = self.encoder.compress(body) if body else b""
+        if not more_body:
+            chunk += self.encoder.finish()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -1,3 +1,5 @@
+import os
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -6,12 +8,38 @@ class Settings(BaseSettings):
     APP_NAME: str = "acorn-prem-be"
     ENV: str = "local"
     RELOAD: bool = False
+    HOST: str = "0.0.0.0"
+    PORT: int = 8000
+    WEB_WORKERS: int = 0
+    WEB_LOOP: str = "auto"
+    WEB_HTTP: str = "auto"
+    WEB_BACKLOG: int = 2048
+    WEB_KEEPALIVE_SECONDS: int = 5
+    WEB_LIMIT_CONCURRENCY: int = 0
+    WEB_GRACEFUL_TIMEOUT_SECONDS: int = 30
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 60 * 30
+    DB_POOL_PRE_PING: bool = True
+    DB_CONNECTION_BUDGET: int = 0
+    DB_POOL_WARMUP: int = 2
+    CACHE_WARMUP_ENABLED: bool = True
+    SHUTDOWN_DRAIN_SECONDS: float = 10
 
     JWT_SECRET: str
     JWT_ALG: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     RESET_TOKEN_EXPIRE_MINUTES: int = 30
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 4096
+    AUTH_TOKEN_CACHE_TTL_SECONDS: int = 300
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 1024
+    # Per-process cache: a user deactivated or demoted in the database keeps access for up to this long
+    # on each worker, and role-claim admin reads stay allowed until the token itself expires.
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: int = 30
 
     LOGIN_MAX_ATTEMPTS: int = 10
     LOGIN_WINDOW_SECONDS: int = 60 * 60
@@ -20,6 +48,13 @@ class Settings(BaseSettings):
     FORGOT_PASSWORD_WINDOW_SECONDS: int = 60 * 60 * 24
     PUBLIC_BLOG_MAX_ATTEMPTS: int = 100
     PUBLIC_BLOG_WINDOW_SECONDS: int = 60 * 60 * 24
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_SQLITE_PATH: str = "rate_limits.sqlite3"
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    RATE_LIMIT_SWEEP_SECONDS: int = 60
+
+    PUBLIC_CACHE_TTL_SECONDS: int = 60
+    PUBLIC_CACHE_MAX_ENTRIES: int = 1024
 
     FRONTEND_URL: str = "http://localhost:3000"
     ADMIN_SEED_EMAIL: str = "admin@acorn.com"
@@ -29,8 +64,27 @@ class Settings(BaseSettings):
     BOOKING_ADMIN_EMAIL: str | None = None
     BOOKING_ADMIN_EMAIL_CC: str | None = None
     RECAPTCHA_SECRET: str | None = None
+    RECAPTCHA_VERIFY_URL: str = "https://www.google.com/recaptcha/api/siteverify"
+    RECAPTCHA_CONNECT_TIMEOUT_SECONDS: float = 2.0
+    RECAPTCHA_READ_TIMEOUT_SECONDS: float = 3.0
+    RECAPTCHA_FAIL_OPEN: bool = False
+    RECAPTCHA_BREAKER_FAILURES: int = 5
+    RECAPTCHA_BREAKER_RESET_SECONDS: int = 30
+
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    COMPRESSION_CACHE_MAX_ENTRIES: int = 256
+    COMPRESSION_CACHE_TTL_SECONDS: int = 300
+
+    SEARCH_TEXT_CONFIG: str = "english"
 
     MEDIA_DIR: str = "uploads"
+    IMAGE_MAX_BYTES: int = 5 * 1024 * 1024
+    UPLOAD_MAX_BODY_BYTES: int = 10 * 1024 * 1024
+    IMAGE_VARIANTS_ENABLED: bool = True
+    IMAGE_VARIANT_WORKERS: int = 2
 
     MAIL_USERNAME: str
     MAIL_PASSWORD: str
@@ -39,5 +93,27 @@ class Settings(BaseSettings):
     MAIL_PORT: int = 587
     MAIL_STARTTLS: bool = True
     MAIL_SSL_TLS: bool = False
+    MAIL_TIMEOUT_SECONDS: int = 30
+    MAIL_POOL_SIZE: int = 2
+    MAIL_POOL_IDLE_SECONDS: int = 60
+
+    EMAIL_DELIVERY_MODE: str = "inline"
+    EMAIL_OUTBOX_WORKER_ENABLED: bool = True
+    EMAIL_OUTBOX_BATCH_SIZE: int = 20
+    EMAIL_OUTBOX_POLL_SECONDS: int = 5
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 120
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = 30
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS: int = 60 * 60
 
 settings = Settings()
+
+
+def production_server() -> bool:
+    return settings.ENV != "local" and not settings.RELOAD
+
+
+def web_workers() -> int:
+    if not production_server():
+        return 1
+    return settings.WEB_WORKERS or os.process_cpu_count() or 1
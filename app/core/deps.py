@@ -1,41 +1,56 @@
+from uuid import UUID
+
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from jose import JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
+from app.core.principal import Principal, decode_access_token, principal_cache
 from app.db.session import SessionLocal
 from app.db.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> User:
+def _verified_claims(token: str) -> tuple[UUID, dict]:
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALG])
-        user_id: str | None = payload.get("sub")
-        if not user_id:
-            raise JWTError()
-    except JWTError:
+        payload = decode_access_token(token)
+        return UUID(payload["sub"]), payload
+    except (JWTError, ValueError):
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    user = db.get(User, user_id)
-    if not user or not user.is_active:
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> Principal:
+    user_id, _ = _verified_claims(token)
+
+    async def _load() -> Principal | None:
+        user = await db.get(User, user_id)
+        if not user:
+            return None
+        return Principal(id=user.id, role=user.role, email=user.email, is_active=user.is_active)
+
+    principal = await principal_cache.get_or_load(("principal", str(user_id)), _load)
+    if not principal or not principal.is_active:
         raise HTTPException(status_code=401, detail="User not found or inactive")
-    return user
+    return principal
 
 def require_role(*roles: str):
-    def _checker(user: User = Depends(get_current_user)) -> User:
+    async def _checker(user: Principal = Depends(get_current_user)) -> Principal:
         if user.role not in roles:
             raise HTTPException(status_code=403, detail="Insufficient permissions")
         return user
     return _checker
+
+def require_role_claim(*roles: str):
+    async def _checker(token: str = Depends(oauth2_scheme)) -> Principal:
+        user_id, payload = _verified_claims(token)
+        role = payload.get("role")
+        if role not in roles:
+            raise HTTPException(status_code=403, detail="Insufficient permissions")
+        return Principal(id=user_id, role=role)
+    return _checker
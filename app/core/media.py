@@ -0,0 +1,74 @@
+import os
+import re
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_NEGOTIABLE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+_ALTERNATES = {".avif": "image/avif", ".webp": "image/webp"}
+_HASHED_NAME = re.compile(r"^[0-9a-f]{64}(-[a-z]+)?\.[a-z0-9]+$")
+
+
+def _accepted_types(accept: str) -> set[str]:
+    accepted = set()
+    for part in accept.split(","):
+        media_type, _, params = part.strip().partition(";")
+        if re.search(r"\bq=0(\.0*)?\s*$", params):
+            continue
+        accepted.add(media_type.strip().lower())
+    return accepted
+
+
+def _etag(path: str, stat_result: os.stat_result) -> str | None:
+    name = os.path.basename(path)
+    if _HASHED_NAME.match(name):
+        return f'"{name.replace(".", "-")}-{stat_result.st_size:x}"'
+    return None
+
+
+class MediaFiles(StaticFiles):
+    def _negotiate(self, full_path: str, stat_result: os.stat_result, accept: str) -> tuple[str, os.stat_result]:
+        accepted = _accepted_types(accept)
+        root, _ = os.path.splitext(full_path)
+        for suffix, media_type in _ALTERNATES.items():
+            if media_type not in accepted:
+                continue
+            try:
+                alternate = os.stat(root + suffix)
+            except OSError:
+                continue
+            if alternate.st_size < stat_result.st_size:
+                return root + suffix, alternate
+        return full_path, stat_result
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        full_path = os.fspath(full_path)
+        headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+        if os.path.splitext(full_path)[1].lower() in _NEGOTIABLE_SUFFIXES:
+            headers["Vary"] = "Accept"
+            full_path, stat_result = self._negotiate(full_path, stat_result, request_headers.get("accept", ""))
+        etag = _etag(full_path, stat_result)
+        if etag:
+            headers["ETag"] = etag
+
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            headers=headers,
+            media_type=_ALTERNATES.get(os.path.splitext(full_path)[1]),
+            stat_result=stat_result,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,37 @@
+import threading
+from collections import deque
+
+
+class LatencyStats:
+    def __init__(self, sample_size: int = 1024) -> None:
+        self._samples: deque[float] = deque(maxlen=sample_size)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+            self._samples.append(seconds)
+
+    def snapshot(self) -> dict[str, int | float]:
+        with self._lock:
+            samples = sorted(self._samples)
+            count, total, maximum = self.count, self.total, self.max
+
+        def _percentile(fraction: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+        return {
+            "count": count,
+            "avg_ms": round(total / count * 1000, 3) if count else 0.0,
+            "p50_ms": round(_percentile(0.50) * 1000, 3),
+            "p95_ms": round(_percentile(0.95) * 1000, 3),
+            "p99_ms": round(_percentile(0.99) * 1000, 3),
+            "max_ms": round(maximum * 1000, 3),
+        }
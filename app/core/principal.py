@@ -0,0 +1,42 @@
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from jose import JWTError, jwt
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    id: UUID
+    role: str
+    email: str | None = None
+    is_active: bool = True
+
+
+token_cache = TTLCache(
+    max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+)
+principal_cache = TTLCache(
+    max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def decode_access_token(token: str) -> dict:
+    payload = token_cache.get(("token", token))
+    if payload is None:
+        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALG])
+        if not payload.get("sub"):
+            raise JWTError()
+        token_cache.set(("token", token), payload)
+    elif payload.get("exp") is not None and payload["exp"] <= time.time():
+        raise JWTError("Signature has expired.")
+    return payload
+
+
+def invalidate_principal(user_id: UUID | str) -> None:
+    principal_cache.invalidate(("principal", str(user_id)))
@@ -1,9 +1,21 @@
+import asyncio
+import logging
 import time
-from collections import defaultdict, deque
-from typing import Deque
 
 from fastapi import HTTPException, Request
 
+from app.core.config import settings
+from app.core.rate_limit_stores import (
+    FAILURE,
+    HIT,
+    MemoryRateLimitStore,
+    PostgresRateLimitStore,
+    RateLimitStore,
+    SQLiteRateLimitStore,
+)
+
+logger = logging.getLogger(__name__)
+
 
 def get_client_ip(request: Request) -> str:
     forwarded_for = request.headers.get("x-forwarded-for")
@@ -14,65 +26,73 @@ def get_client_ip(request: Request) -> str:
     return "unknown"
 
 
+def create_store(backend: str) -> RateLimitStore:
+    backend = backend.lower()
+    if backend == "memory":
+        return MemoryRateLimitStore(settings.RATE_LIMIT_MAX_KEYS)
+    if backend == "sqlite":
+        return SQLiteRateLimitStore(settings.RATE_LIMIT_SQLITE_PATH)
+    if backend == "postgres":
+        from app.db.session import engine
+
+        return PostgresRateLimitStore(engine)
+    raise ValueError(f"Unknown RATE_LIMIT_BACKEND: {backend}")
+
+
+_store: RateLimitStore | None = None
+
+
+def get_store() -> RateLimitStore:
+    global _store
+    if _store is None:
+        _store = create_store(settings.RATE_LIMIT_BACKEND)
+    return _store
+
+
 class RateLimiter:
     def __init__(
         self,
+        name: str,
         max_attempts: int,
         window_seconds: int,
         ban_seconds: int = 0,
         error_detail: str = "Rate limit exceeded",
+        store: RateLimitStore | None = None,
     ) -> None:
+        self.name = name
         self.max_attempts = max_attempts
         self.window_seconds = window_seconds
         self.ban_seconds = ban_seconds
         self.error_detail = error_detail
-        self._requests: dict[str, Deque[float]] = defaultdict(deque)
-        self._banned_until: dict[str, float] = {}
-
-    def _prune(self, key: str, now: float) -> None:
-        window_start = now - self.window_seconds
-        bucket = self._requests[key]
-        while bucket and bucket[0] < window_start:
-            bucket.popleft()
-        if not bucket:
-            self._requests.pop(key, None)
-
-    def _check_ban(self, key: str, now: float) -> None:
-        banned_until = self._banned_until.get(key)
-        if not banned_until:
-            return
-        if banned_until <= now:
-            self._banned_until.pop(key, None)
-            return
-        raise HTTPException(status_code=429, detail=self.error_detail)
-
-    def hit(self, key: str) -> None:
-        now = time.time()
-        self._check_ban(key, now)
-        self._prune(key, now)
-        bucket = self._requests.setdefault(key, deque())
-        if len(bucket) >= self.max_attempts:
-            if self.ban_seconds:
-                self._banned_until[key] = now + self.ban_seconds
-            raise HTTPException(status_code=429, detail=self.error_detail)
-        bucket.append(now)
-
-    def check(self, key: str) -> None:
-        now = time.time()
-        self._check_ban(key, now)
-        self._prune(key, now)
-
-    def register_failure(self, key: str) -> None:
-        now = time.time()
-        self._check_ban(key, now)
-        self._prune(key, now)
-        bucket = self._requests.setdefault(key, deque())
-        bucket.append(now)
-        if len(bucket) > self.max_attempts:
-            if self.ban_seconds:
-                self._banned_until[key] = now + self.ban_seconds
-            raise HTTPException(status_code=429, detail=self.error_detail)
-
-    def reset(self, key: str) -> None:
-        self._requests.pop(key, None)
-        self._banned_until.pop(key, None)
+        self._store = store
+
+    @property
+    def store(self) -> RateLimitStore:
+        return self._store or get_store()
+
+    def _deny(self) -> HTTPException:
+        return HTTPException(status_code=429, detail=self.error_detail)
+
+    async def hit(self, key: str) -> None:
+        if not await self.store.apply(self, key, HIT, time.time()):
+            raise self._deny()
+
+    async def check(self, key: str) -> None:
+        if await self.store.is_banned(self, key, time.time()):
+            raise self._deny()
+
+    async def register_failure(self, key: str) -> None:
+        if not await self.store.apply(self, key, FAILURE, time.time()):
+            raise self._deny()
+
+    async def reset(self, key: str) -> None:
+        await self.store.reset(self, key)
+
+
+async def run_sweeper(interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await get_store().sweep(time.time())
+        except Exception:
+            logger.exception("Rate limit sweep failed")
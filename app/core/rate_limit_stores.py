@@ -0,0 +1,285 @@
+import asyncio
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Protocol
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+if TYPE_CHECKING:
+    from app.core.rate_limit import RateLimiter
+
+HIT = "hit"
+FAILURE = "failure"
+
+
+class RateLimitState:
+    __slots__ = ("window_index", "prev_count", "curr_count", "banned_until", "expires_at")
+
+    def __init__(
+        self,
+        window_index: int,
+        prev_count: int = 0,
+        curr_count: int = 0,
+        banned_until: float | None = None,
+        expires_at: float = 0.0,
+    ) -> None:
+        self.window_index = window_index
+        self.prev_count = prev_count
+        self.curr_count = curr_count
+        self.banned_until = banned_until
+        self.expires_at = expires_at
+
+    def is_banned(self, now: float) -> bool:
+        return bool(self.banned_until and self.banned_until > now)
+
+
+def advance(
+    state: RateLimitState | None,
+    limiter: "RateLimiter",
+    op: str,
+    now: float,
+) -> tuple[RateLimitState, bool]:
+    window = limiter.window_seconds
+    index = int(now // window)
+    if state is None:
+        state = RateLimitState(index)
+    elif state.window_index != index:
+        state.prev_count = state.curr_count if state.window_index == index - 1 else 0
+        state.curr_count = 0
+        state.window_index = index
+    if state.is_banned(now):
+        state.expires_at = max((index + 2) * window, state.banned_until)
+        return state, False
+
+    estimate = state.prev_count * (1 - (now / window - index)) + state.curr_count
+    if op == HIT:
+        allowed = estimate < limiter.max_attempts
+        if allowed:
+            state.curr_count += 1
+    else:
+        state.curr_count += 1
+        allowed = estimate + 1 <= limiter.max_attempts
+    state.banned_until = now + limiter.ban_seconds if not allowed and limiter.ban_seconds else None
+    state.expires_at = max((index + 2) * window, state.banned_until or 0)
+    return state, allowed
+
+
+class RateLimitStore(Protocol):
+    async def apply(self, limiter: "RateLimiter", key: str, op: str, now: float) -> bool: ...
+
+    async def is_banned(self, limiter: "RateLimiter", key: str, now: float) -> bool: ...
+
+    async def reset(self, limiter: "RateLimiter", key: str) -> None: ...
+
+    async def sweep(self, now: float) -> int: ...
+
+
+class MemoryRateLimitStore:
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._scopes: dict[str, OrderedDict[str, RateLimitState]] = {}
+        self.evictions = 0
+
+    async def apply(self, limiter: "RateLimiter", key: str, op: str, now: float) -> bool:
+        entries = self._scopes.setdefault(limiter.name, OrderedDict())
+        state, allowed = advance(entries.get(key), limiter, op, now)
+        entries[key] = state
+        entries.move_to_end(key)
+        while len(entries) > self.max_keys:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return allowed
+
+    async def is_banned(self, limiter: "RateLimiter", key: str, now: float) -> bool:
+        state = self._scopes.get(limiter.name, {}).get(key)
+        return bool(state and state.is_banned(now))
+
+    async def reset(self, limiter: "RateLimiter", key: str) -> None:
+        self._scopes.get(limiter.name, {}).pop(key, None)
+
+    async def sweep(self, now: float) -> int:
+        removed = 0
+        for entries in self._scopes.values():
+            expired = [key for key, state in entries.items() if state.expires_at <= now]
+            for key in expired:
+                del entries[key]
+            removed += len(expired)
+        return removed
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limits (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    window_index INTEGER NOT NULL,
+    prev_count INTEGER NOT NULL,
+    curr_count INTEGER NOT NULL,
+    banned_until REAL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (scope, key)
+)
+"""
+
+
+class SQLiteRateLimitStore:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SQLITE_SCHEMA)
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_rate_limits_expires_at ON rate_limits (expires_at)")
+            self._local.conn = conn
+        return conn
+
+    def _apply(self, scope: str, key: str, limiter: "RateLimiter", op: str, now: float) -> bool:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT window_index, prev_count, curr_count, banned_until FROM rate_limits "
+                "WHERE scope = ? AND key = ?",
+                (scope, key),
+            ).fetchone()
+            state, allowed = advance(RateLimitState(*row) if row else None, limiter, op, now)
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limits "
+                "(scope, key, window_index, prev_count, curr_count, banned_until, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    scope,
+                    key,
+                    state.window_index,
+                    state.prev_count,
+                    state.curr_count,
+                    state.banned_until,
+                    state.expires_at,
+                ),
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return allowed
+
+    def _is_banned(self, scope: str, key: str, now: float) -> bool:
+        row = self._connect().execute(
+            "SELECT banned_until FROM rate_limits WHERE scope = ? AND key = ?",
+            (scope, key),
+        ).fetchone()
+        return bool(row and row[0] and row[0] > now)
+
+    def _reset(self, scope: str, key: str) -> None:
+        self._connect().execute("DELETE FROM rate_limits WHERE scope = ? AND key = ?", (scope, key))
+
+    def _sweep(self, now: float) -> int:
+        return self._connect().execute("DELETE FROM rate_limits WHERE expires_at <= ?", (now,)).rowcount
+
+    async def apply(self, limiter: "RateLimiter", key: str, op: str, now: float) -> bool:
+        return await asyncio.to_thread(self._apply, limiter.name, key, limiter, op, now)
+
+    async def is_banned(self, limiter: "RateLimiter", key: str, now: float) -> bool:
+        return await asyncio.to_thread(self._is_banned, limiter.name, key, now)
+
+    async def reset(self, limiter: "RateLimiter", key: str) -> None:
+        await asyncio.to_thread(self._reset, limiter.name, key)
+
+    async def sweep(self, now: float) -> int:
+        return await asyncio.to_thread(self._sweep, now)
+
+
+_PG_PREV = (
+    "CASE WHEN rate_limits.window_index = :window_index THEN rate_limits.prev_count "
+    "WHEN rate_limits.window_index = :window_index - 1 THEN rate_limits.curr_count ELSE 0 END"
+)
+_PG_CURR = "CASE WHEN rate_limits.window_index = :window_index THEN rate_limits.curr_count ELSE 0 END"
+_PG_BANNED = "COALESCE(rate_limits.banned_until > :now, false)"
+_PG_ESTIMATE = f"({_PG_PREV}) * :weight + ({_PG_CURR})"
+_PG_ALLOWED = {
+    HIT: f"(NOT {_PG_BANNED} AND {_PG_ESTIMATE} < :max_attempts)",
+    FAILURE: f"(NOT {_PG_BANNED} AND {_PG_ESTIMATE} + 1 <= :max_attempts)",
+}
+_PG_COUNTED = {
+    HIT: _PG_ALLOWED[HIT],
+    FAILURE: f"(NOT {_PG_BANNED})",
+}
+
+
+def _pg_upsert(op: str):
+    allowed = _PG_ALLOWED[op]
+    banned_until = (
+        f"CASE WHEN {_PG_BANNED} THEN rate_limits.banned_until "
+        f"WHEN NOT {allowed} THEN CAST(:ban_until AS double precision) ELSE NULL END"
+    )
+    return text(
+        "INSERT INTO rate_limits "
+        "(scope, key, window_index, prev_count, curr_count, banned_until, expires_at, allowed) "
+        "VALUES (:scope, :key, :window_index, 0, :initial_count, "
+        "CAST(:initial_banned_until AS double precision), :initial_expires_at, :initial_allowed) "
+        "ON CONFLICT (scope, key) DO UPDATE SET "
+        "window_index = :window_index, "
+        f"prev_count = {_PG_PREV}, "
+        f"curr_count = ({_PG_CURR}) + CASE WHEN {_PG_COUNTED[op]} THEN 1 ELSE 0 END, "
+        f"banned_until = {banned_until}, "
+        f"expires_at = GREATEST(CAST(:window_expires_at AS double precision), {banned_until}), "
+        f"allowed = {allowed} "
+        "RETURNING allowed"
+    )
+
+
+_PG_UPSERTS = {op: _pg_upsert(op) for op in (HIT, FAILURE)}
+
+
+class PostgresRateLimitStore:
+    def __init__(self, engine: AsyncEngine) -> None:
+        if engine.dialect.name != "postgresql":
+            raise ValueError("RATE_LIMIT_BACKEND=postgres requires a PostgreSQL DATABASE_URL")
+        self.engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+    async def apply(self, limiter: "RateLimiter", key: str, op: str, now: float) -> bool:
+        window = limiter.window_seconds
+        index = int(now // window)
+        initial, initial_allowed = advance(None, limiter, op, now)
+        params = {
+            "scope": limiter.name,
+            "key": key,
+            "now": now,
+            "window_index": index,
+            "weight": 1 - (now / window - index),
+            "max_attempts": limiter.max_attempts,
+            "ban_until": now + limiter.ban_seconds if limiter.ban_seconds else None,
+            "window_expires_at": float((index + 2) * window),
+            "initial_count": initial.curr_count,
+            "initial_banned_until": initial.banned_until,
+            "initial_expires_at": initial.expires_at,
+            "initial_allowed": initial_allowed,
+        }
+        async with self.engine.connect() as conn:
+            return bool(await conn.scalar(_PG_UPSERTS[op], params))
+
+    async def is_banned(self, limiter: "RateLimiter", key: str, now: float) -> bool:
+        async with self.engine.connect() as conn:
+            banned_until = await conn.scalar(
+                text("SELECT banned_until FROM rate_limits WHERE scope = :scope AND key = :key"),
+                {"scope": limiter.name, "key": key},
+            )
+        return bool(banned_until and banned_until > now)
+
+    async def reset(self, limiter: "RateLimiter", key: str) -> None:
+        async with self.engine.connect() as conn:
+            await conn.execute(
+                text("DELETE FROM rate_limits WHERE scope = :scope AND key = :key"),
+                {"scope": limiter.name, "key": key},
+            )
+
+    async def sweep(self, now: float) -> int:
+        async with self.engine.connect() as conn:
+            result = await conn.execute(text("DELETE FROM rate_limits WHERE expires_at <= :now"), {"now": now})
+        return result.rowcount
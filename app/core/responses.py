@@ -0,0 +1,40 @@
+from functools import cache
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return to_json(content, inf_nan_mode="null")
+
+
+@cache
+def adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def validate(schema: Any, value: Any) -> Any:
+    return adapter(schema).validate_python(value, from_attributes=True)
+
+
+def dump_json(schema: Any, value: Any) -> bytes:
+    type_adapter = adapter(schema)
+    return type_adapter.dump_json(type_adapter.validate_python(value, from_attributes=True))
+
+
+_BODY_HEADERS = {b"content-length", b"content-type"}
+
+
+def json_response(schema: Any, value: Any, response: Response | None = None, status_code: int = 200) -> Response:
+    result = Response(dump_json(schema, value), status_code=status_code, media_type="application/json")
+    if response is not None:
+        # FastAPI drops the injected response's headers when a handler returns its own Response, so carry
+        # over what the handler set on it (ETag, Last-Modified, X-Next-Cursor, cookies), minus body headers.
+        result.headers.raw.extend(
+            (name, value) for name, value in response.headers.raw if name not in _BODY_HEADERS
+        )
+    return result
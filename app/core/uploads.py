@@ -0,0 +1,60 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO
+
+from fastapi import HTTPException
+
+CHUNK_SIZE = 64 * 1024
+
+_IMAGE_SIGNATURES = {
+    b"\x89PNG\r\n\x1a\n": ".png",
+    b"\xff\xd8\xff": ".jpg",
+}
+
+
+def sniff_image_type(head: bytes) -> str | None:
+    for signature, ext in _IMAGE_SIGNATURES.items():
+        if head.startswith(signature):
+            return ext
+    return None
+
+
+def save_image(source: BinaryIO, directory: Path, max_bytes: int) -> str:
+    head = source.read(CHUNK_SIZE)
+    ext = sniff_image_type(head)
+    if not ext:
+        raise HTTPException(status_code=400, detail="Unsupported image type")
+
+    directory.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".upload-", suffix=".part")
+    try:
+        digest = hashlib.sha256()
+        with os.fdopen(fd, "wb") as buffer:
+            size = 0
+            chunk = head
+            while chunk:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Image must be {max_bytes // (1024 * 1024)} MB or smaller",
+                    )
+                digest.update(chunk)
+                buffer.write(chunk)
+                chunk = source.read(CHUNK_SIZE)
+            buffer.flush()
+            os.fsync(buffer.fileno())
+        filename = f"{digest.hexdigest()}{ext}"
+        if (directory / filename).exists():
+            os.unlink(temp_path)
+        else:
+            os.replace(temp_path, directory / filename)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return filename
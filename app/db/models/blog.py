@@ -1,6 +1,6 @@
 import uuid
-from sqlalchemy import String, Text, DateTime, func, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import JSON, String, Text, DateTime, func, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
@@ -15,7 +15,13 @@ class Blog(Base):
     status: Mapped[str] = mapped_column(String(20), default="DRAFT")  # DRAFT | PUBLISHED
 
     image_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    image_variants: Mapped[dict | None] = mapped_column(JSON(none_as_null=True), nullable=True)
     posted_by: Mapped[str] = mapped_column(String(255), default="Dr. Prem Thurairajah")
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        nullable=True,
+        deferred=True,
+    )
 
     category_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("categories.id"), nullable=False)
     author_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -23,3 +29,18 @@ class Blog(Base):
     created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     published_at: Mapped[str | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+Index(
+    "ix_blogs_status_published_created_id",
+    Blog.status,
+    Blog.published_at.desc().nulls_last(),
+    Blog.created_at.desc(),
+    Blog.id,
+).ddl_if(dialect="postgresql")
+
+Index(
+    "ix_blogs_search_vector",
+    Blog.search_vector,
+    postgresql_using="gin",
+).ddl_if(dialect="postgresql")
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import String, Text, DateTime, func
+from sqlalchemy import JSON, Index, Integer, String, Text, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
@@ -11,9 +11,16 @@ class EmailLog(Base):
     to_email: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
     subject: Mapped[str] = mapped_column(String(255), nullable=False)
     body: Mapped[str] = mapped_column(Text, nullable=False)
+    html_body: Mapped[str | None] = mapped_column(Text, nullable=True)
+    cc_emails: Mapped[list[str] | None] = mapped_column(JSON(none_as_null=True), nullable=True)
 
-    status: Mapped[str] = mapped_column(String(50), default="QUEUED")  # QUEUED | SENT | FAILED
+    status: Mapped[str] = mapped_column(String(50), default="QUEUED")  # QUEUED | SENDING | SENT | FAILED
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    next_attempt_at: Mapped[str | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now())
     sent_at: Mapped[str | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+Index("ix_email_logs_status_next_attempt_at", EmailLog.status, EmailLog.next_attempt_at)
@@ -0,0 +1,16 @@
+from sqlalchemy import BigInteger, Boolean, Float, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.base import Base
+
+
+class RateLimit(Base):
+    __tablename__ = "rate_limits"
+
+    scope: Mapped[str] = mapped_column(String(50), primary_key=True)
+    key: Mapped[str] = mapped_column(Text, primary_key=True)
+    window_index: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    prev_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    curr_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    banned_until: Mapped[float | None] = mapped_column(Float, nullable=True)
+    expires_at: Mapped[float] = mapped_column(Float, nullable=False, index=True)
+    allowed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
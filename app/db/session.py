@@ -1,13 +1,43 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from app.core.config import settings
+import asyncio
+from contextlib import AsyncExitStack
 
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.core.config import settings, web_workers
+from app.db.pool_metrics import InstrumentedQueuePool, pool_metrics
 
-def _database_url() -> str:
+
+def database_url() -> str:
     if settings.DATABASE_URL.startswith("postgresql://"):
         return settings.DATABASE_URL.replace("postgresql://", "postgresql+psycopg://", 1)
     return settings.DATABASE_URL
 
 
-engine = create_engine(_database_url(), pool_pre_ping=True)
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+def pool_limits() -> tuple[int, int]:
+    if settings.DB_CONNECTION_BUDGET <= 0:
+        return settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+    per_worker = max(1, settings.DB_CONNECTION_BUDGET // web_workers())
+    pool_size = min(settings.DB_POOL_SIZE, per_worker)
+    return pool_size, per_worker - pool_size
+
+
+POOL_SIZE, MAX_OVERFLOW = pool_limits()
+engine = create_async_engine(
+    database_url(),
+    poolclass=InstrumentedQueuePool,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+pool_metrics.install(engine.sync_engine)
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+async def warm_pool(connections: int) -> int:
+    connections = max(0, min(connections, POOL_SIZE))
+    async with AsyncExitStack() as stack:
+        async with asyncio.TaskGroup() as group:
+            for _ in range(connections):
+                group.create_task(stack.enter_async_context(engine.connect()))
+    return connections
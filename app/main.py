@@ -1,22 +1,103 @@
+import asyncio
+import logging
 import os
 import re
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager, suppress
 from urllib.parse import urlparse
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse, Response
-from sqlalchemy import inspect, text
 
+from app.core.body_limit import MaxBodySizeMiddleware
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.db.base import Base
-from app.db.session import SessionLocal, engine
-from app.routers import auth, blog, email, categories, booking, users, public_blogs, public_categories
-from app.services import auth_service
+from app.core.media import MediaFiles
+from app.core.rate_limit import run_sweeper
+from app.core.responses import FastJSONResponse
+from app.core.security import PasswordHasherBusy, password_hasher
+from app.db.schema import check_revision
+from app.db.session import MAX_OVERFLOW, POOL_SIZE, SessionLocal, engine, warm_pool
+from app.routers import auth, blog, email, categories, booking, users, public_blogs, public_categories, metrics
+from app.services import auth_service, blog_service, category_service, email_outbox, email_service, email_templates, image_variants, mail_transport, recaptcha_service, search_service
+
+logger = logging.getLogger("uvicorn.error")
 
 os.makedirs(settings.MEDIA_DIR, exist_ok=True)
 
-app = FastAPI(title=settings.APP_NAME)
+
+@contextmanager
+def _phase(name: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        logger.info("%s took %.1f ms", name, (time.perf_counter() - started) * 1000)
+
+
+async def _warm_caches() -> None:
+    async with SessionLocal() as db:
+        await category_service.list_public_categories(db)
+        await blog_service.list_published_blogs(db)
+        if not search_service.uses_tsvector(engine.dialect.name):
+            await search_service.inverted_index.ensure_built(db)
+
+
+async def _startup() -> None:
+    with _phase("Schema revision check"):
+        async with engine.connect() as conn:
+            await check_revision(conn)
+    logger.info("Database pool: %d connections + %d overflow per worker", POOL_SIZE, MAX_OVERFLOW)
+    with _phase(f"Database pool warm-up ({settings.DB_POOL_WARMUP} connections)"):
+        await warm_pool(settings.DB_POOL_WARMUP)
+    with _phase("Default admin"):
+        async with SessionLocal() as db:
+            await auth_service.ensure_default_admin(db)
+    with _phase("Email templates"):
+        email_templates.load_templates()
+    if settings.CACHE_WARMUP_ENABLED:
+        with _phase("Public cache warm-up"):
+            await _warm_caches()
+    with _phase("Clients"):
+        if settings.MAIL_SERVER and settings.MAIL_FROM:
+            mail_transport.get_pool()
+        recaptcha_service.get_client()
+    app.state.rate_limit_sweeper = asyncio.create_task(run_sweeper(settings.RATE_LIMIT_SWEEP_SECONDS))
+    if email_service.uses_outbox() and settings.EMAIL_OUTBOX_WORKER_ENABLED:
+        email_outbox.start_worker()
+
+
+async def _shutdown() -> None:
+    with _phase("Background workers"):
+        sweeper = app.state.rate_limit_sweeper
+        sweeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await sweeper
+        await email_outbox.stop_worker(settings.SHUTDOWN_DRAIN_SECONDS)
+    with _phase("Executors"):
+        password_hasher.shutdown()
+        image_variants.shutdown_pool()
+    with _phase("Clients"):
+        await mail_transport.close_pool()
+        await recaptcha_service.close_client()
+    with _phase("Database pool"):
+        await engine.dispose()
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    with _phase("Startup"):
+        await _startup()
+    try:
+        yield
+    finally:
+        with _phase("Shutdown"):
+            await _shutdown()
+
+
+app = FastAPI(title=settings.APP_NAME, default_response_class=FastJSONResponse, lifespan=lifespan)
 
 
 def _origin_from_url(value: str) -> str | None:
@@ -53,6 +134,7 @@ def _apply_cors_headers(response: Response, origin: str | None) -> Response:
     return response
 
 
+app.add_middleware(MaxBodySizeMiddleware, max_bytes=settings.UPLOAD_MAX_BODY_BYTES, path_prefixes=("/blogs",))
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_cors_origins(),
@@ -60,7 +142,9 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE, exclude_prefixes=("/media",))
 
 
 @app.middleware("http")
@@ -76,20 +160,7 @@ async def add_cors_headers_to_all_responses(request: Request, call_next):
     return _apply_cors_headers(response, origin)
 
 
-app.mount("/media", StaticFiles(directory=settings.MEDIA_DIR), name="media")
-
-
-def _drop_excerpt_column_if_present() -> None:
-    inspector = inspect(engine)
-    if "blogs" not in inspector.get_table_names():
-        return
-    columns = {column["name"] for column in inspector.get_columns("blogs")}
-    if "excerpt_html" not in columns:
-        return
-    if engine.dialect.name != "postgresql":
-        return
-    with engine.begin() as conn:
-        conn.execute(text("ALTER TABLE blogs DROP COLUMN IF EXISTS excerpt_html"))
+app.mount("/media", MediaFiles(directory=settings.MEDIA_DIR), name="media")
 
 
 @app.exception_handler(HTTPException)
@@ -98,6 +169,15 @@ async def http_exception_handler(_: Request, exc: HTTPException) -> JSONResponse
     return JSONResponse(status_code=exc.status_code, content={"status": exc.status_code, "message": message})
 
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(_: Request, __: PasswordHasherBusy) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"status": 503, "message": "Server is busy. Try again shortly."},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(_: Request, exc: RequestValidationError) -> JSONResponse:
     errors = exc.errors()
@@ -111,19 +191,8 @@ async def validation_exception_handler(_: Request, exc: RequestValidationError)
     return JSONResponse(status_code=422, content={"status": 422, "message": message})
 
 
-@app.on_event("startup")
-def on_startup() -> None:
-    Base.metadata.create_all(bind=engine)
-    _drop_excerpt_column_if_present()
-    db = SessionLocal()
-    try:
-        auth_service.ensure_default_admin(db)
-    finally:
-        db.close()
-
-
 @app.get("/health")
-def health_check() -> dict[str, str]:
+async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
@@ -135,3 +204,4 @@ app.include_router(booking.router)
 app.include_router(users.router)
 app.include_router(public_blogs.router)
 app.include_router(public_categories.router)
+app.include_router(metrics.router)
@@ -1,10 +1,15 @@
+from datetime import datetime
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy import update as sql_update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from app.core.pagination import decode_cursor, encode_cursor
 from app.db.models.blog import Blog
 from app.schemas.blog import BlogCreate, BlogUpdate
 
 
-def create(db: Session, author_id: UUID, data: BlogCreate) -> Blog:
+async def create(db: AsyncSession, author_id: UUID, data: BlogCreate, search_vector=None) -> Blog:
     blog = Blog(
         title=data.title,
         content_html=data.content_html,
@@ -13,43 +18,147 @@ def create(db: Session, author_id: UUID, data: BlogCreate) -> Blog:
         image_url=data.image_url,
         posted_by=data.posted_by or "Dr. Prem Thurairajah",
         author_id=author_id,
+        search_vector=search_vector,
     )
     db.add(blog)
-    db.commit()
-    db.refresh(blog)
+    await db.commit()
+    await db.refresh(blog)
     return blog
 
 
-def list_blogs(db: Session, skip: int = 0, limit: int = 12) -> list[Blog]:
-    return (
-        db.query(Blog)
-        .order_by(Blog.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+def _parse_datetime(value: str | None) -> datetime | None:
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def _parse_id(value: str | None) -> UUID:
+    try:
+        return UUID(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+
+def _created_after(created_at: datetime | None, blog_id: UUID):
+    if created_at is None:
+        raise ValueError("Invalid cursor")
+    return or_(
+        Blog.created_at < created_at,
+        and_(Blog.created_at == created_at, Blog.id > blog_id),
     )
 
 
-def list_published_blogs(db: Session, skip: int = 0, limit: int = 12) -> list[Blog]:
-    return (
-        db.query(Blog)
-        .filter(Blog.status == "PUBLISHED")
-        .order_by(Blog.published_at.desc().nullslast(), Blog.created_at.desc())
+def blog_cursor(blog) -> str:
+    return encode_cursor([blog.created_at.isoformat(), str(blog.id)])
+
+
+def published_blog_cursor(blog) -> str:
+    published_at = blog.published_at.isoformat() if blog.published_at else None
+    return encode_cursor([published_at, blog.created_at.isoformat(), str(blog.id)])
+
+
+def _with_content(stmt, include_content: bool):
+    if include_content:
+        return stmt
+    return stmt.options(defer(Blog.content_html))
+
+
+async def list_blogs(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 12,
+    cursor: str | None = None,
+    include_content: bool = False,
+) -> list[Blog]:
+    stmt = _with_content(select(Blog), include_content).order_by(Blog.created_at.desc(), Blog.id.asc())
+    if cursor:
+        created_raw, id_raw = decode_cursor(cursor, 2)
+        stmt = stmt.where(_created_after(_parse_datetime(created_raw), _parse_id(id_raw)))
+    else:
+        stmt = stmt.offset(skip)
+    return list(await db.scalars(stmt.limit(limit)))
+
+
+async def list_published_blogs(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 12,
+    cursor: str | None = None,
+    include_content: bool = False,
+) -> list[Blog]:
+    stmt = (
+        _with_content(select(Blog), include_content)
+        .where(Blog.status == "PUBLISHED")
+        .order_by(Blog.published_at.desc().nullslast(), Blog.created_at.desc(), Blog.id.asc())
+    )
+    if cursor:
+        published_raw, created_raw, id_raw = decode_cursor(cursor, 3)
+        published_at = _parse_datetime(published_raw)
+        created_after = _created_after(_parse_datetime(created_raw), _parse_id(id_raw))
+        if published_at is None:
+            stmt = stmt.where(Blog.published_at.is_(None), created_after)
+        else:
+            stmt = stmt.where(
+                or_(
+                    Blog.published_at < published_at,
+                    Blog.published_at.is_(None),
+                    and_(Blog.published_at == published_at, created_after),
+                )
+            )
+    else:
+        stmt = stmt.offset(skip)
+    return list(await db.scalars(stmt.limit(limit)))
+
+
+async def search_published_blogs(
+    db: AsyncSession,
+    query,
+    skip: int = 0,
+    limit: int = 12,
+    include_content: bool = False,
+) -> list[Blog]:
+    stmt = (
+        _with_content(select(Blog), include_content)
+        .where(Blog.status == "PUBLISHED", Blog.search_vector.bool_op("@@")(query))
+        .order_by(
+            func.ts_rank_cd(Blog.search_vector, query).desc(),
+            Blog.published_at.desc().nullslast(),
+            Blog.id.asc(),
+        )
         .offset(skip)
         .limit(limit)
-        .all()
     )
+    return list(await db.scalars(stmt))
+
 
+async def list_published_by_ids(db: AsyncSession, blog_ids: list[UUID], include_content: bool = False) -> list[Blog]:
+    if not blog_ids:
+        return []
+    stmt = _with_content(select(Blog), include_content).where(Blog.id.in_(blog_ids), Blog.status == "PUBLISHED")
+    blogs = {blog.id: blog for blog in await db.scalars(stmt)}
+    return [blogs[blog_id] for blog_id in blog_ids if blog_id in blogs]
 
-def get(db: Session, blog_id: UUID) -> Blog | None:
-    return db.get(Blog, blog_id)
 
+async def get(db: AsyncSession, blog_id: UUID) -> Blog | None:
+    return await db.get(Blog, blog_id)
 
-def get_published_blog(db: Session, blog_id: UUID) -> Blog | None:
-    return db.query(Blog).filter(Blog.id == blog_id, Blog.status == "PUBLISHED").first()
 
+async def get_published_blog(db: AsyncSession, blog_id: UUID) -> Blog | None:
+    return await db.scalar(select(Blog).where(Blog.id == blog_id, Blog.status == "PUBLISHED").limit(1))
+
+
+async def published_blogs_version(db: AsyncSession) -> tuple[datetime | None, int]:
+    result = await db.execute(
+        select(func.max(Blog.updated_at), func.count(Blog.id)).where(Blog.status == "PUBLISHED")
+    )
+    last_updated, total = result.one()
+    return last_updated, total
 
-def update(db: Session, blog: Blog, data: BlogUpdate) -> Blog:
+
+async def update(db: AsyncSession, blog: Blog, data: BlogUpdate, search_vector=None) -> Blog:
     if data.title is not None:
         blog.title = data.title
     if data.content_html is not None:
@@ -58,14 +167,37 @@ def update(db: Session, blog: Blog, data: BlogUpdate) -> Blog:
         blog.category_id = data.category_id
     if data.status is not None:
         blog.status = data.status
-    if data.image_url is not None:
+    if data.image_url is not None and data.image_url != blog.image_url:
         blog.image_url = data.image_url
+        blog.image_variants = None
+    if search_vector is not None:
+        blog.search_vector = search_vector
     db.add(blog)
-    db.commit()
-    db.refresh(blog)
+    await db.commit()
+    await db.refresh(blog)
     return blog
 
 
-def delete(db: Session, blog: Blog) -> None:
-    db.delete(blog)
-    db.commit()
+async def local_image_urls(db: AsyncSession, prefix: str, missing_variants_only: bool = True) -> set[str]:
+    stmt = select(Blog.image_url).where(Blog.image_url.startswith(prefix)).distinct()
+    if missing_variants_only:
+        stmt = stmt.where(Blog.image_variants.is_(None))
+    return set(await db.scalars(stmt))
+
+
+async def set_image_variants(db: AsyncSession, image_url: str, variants: dict) -> list[tuple[UUID, str]]:
+    result = await db.execute(
+        sql_update(Blog)
+        .where(Blog.image_url == image_url)
+        .values(image_variants=variants)
+        .returning(Blog.id, Blog.status)
+        .execution_options(synchronize_session=False)
+    )
+    rows = [tuple(row) for row in result.all()]
+    await db.commit()
+    return rows
+
+
+async def delete(db: AsyncSession, blog: Blog) -> None:
+    await db.delete(blog)
+    await db.commit()
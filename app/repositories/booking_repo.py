@@ -1,10 +1,11 @@
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.booking import Booking
 from app.schemas.booking import BookingCreate
 
 
-def create(db: Session, data: BookingCreate) -> Booking:
+async def create(db: AsyncSession, data: BookingCreate) -> Booking:
     booking = Booking(
         name=data.name.strip(),
         email=data.email,
@@ -15,25 +16,25 @@ def create(db: Session, data: BookingCreate) -> Booking:
         message=data.message,
     )
     db.add(booking)
-    db.commit()
-    db.refresh(booking)
+    await db.commit()
+    await db.refresh(booking)
     return booking
 
 
-def list_bookings(db: Session, skip: int = 0, limit: int = 12) -> list[Booking]:
-    return (
-        db.query(Booking)
+async def list_bookings(db: AsyncSession, skip: int = 0, limit: int = 12) -> list[Booking]:
+    stmt = (
+        select(Booking)
         .order_by(Booking.created_at.desc())
         .offset(skip)
         .limit(limit)
-        .all()
     )
+    return list(await db.scalars(stmt))
 
 
-def get_by_id(db: Session, booking_id: UUID) -> Booking | None:
-    return db.get(Booking, booking_id)
+async def get_by_id(db: AsyncSession, booking_id: UUID) -> Booking | None:
+    return await db.get(Booking, booking_id)
 
 
-def delete(db: Session, booking: Booking) -> None:
-    db.delete(booking)
-    db.commit()
+async def delete(db: AsyncSession, booking: Booking) -> None:
+    await db.delete(booking)
+    await db.commit()
@@ -1,49 +1,86 @@
+from datetime import datetime
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select, update as sql_update
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.category import Category
 from app.db.models.blog import Blog
 from app.schemas.category import CategoryCreate, CategoryUpdate
 
 
-def get_by_id(db: Session, category_id: UUID) -> Category | None:
-    return db.get(Category, category_id)
+async def get_by_id(db: AsyncSession, category_id: UUID) -> Category | None:
+    return await db.get(Category, category_id)
 
 
-def get_by_name(db: Session, name: str) -> Category | None:
-    return db.query(Category).filter(func.lower(Category.name) == name.lower()).first()
+async def get_by_name(db: AsyncSession, name: str) -> Category | None:
+    return await db.scalar(select(Category).where(func.lower(Category.name) == name.lower()).limit(1))
 
 
-def list_categories(db: Session) -> list[Category]:
-    categories = db.query(Category).order_by(Category.name.asc()).all()
-    counts = (
-        db.query(Blog.category_id, func.count(Blog.id))
-        .group_by(Blog.category_id)
-        .all()
+async def list_categories(db: AsyncSession) -> list[Category]:
+    return list(await db.scalars(select(Category).order_by(Category.name.asc())))
+
+
+async def categories_version(db: AsyncSession) -> tuple[datetime | None, int]:
+    result = await db.execute(select(func.max(Category.updated_at), func.count(Category.id)))
+    last_updated, total = result.one()
+    return last_updated, total
+
+
+async def adjust_post_counts(
+    db: AsyncSession,
+    category_id: UUID,
+    total_delta: int = 0,
+    published_delta: int = 0,
+) -> None:
+    if not total_delta and not published_delta:
+        return
+    await db.execute(
+        sql_update(Category)
+        .where(Category.id == category_id)
+        .values(
+            posts_count=Category.posts_count + total_delta,
+            published_posts_count=Category.published_posts_count + published_delta,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def reconcile_post_counts(db: AsyncSession) -> int:
+    total = (
+        select(func.count(Blog.id))
+        .where(Blog.category_id == Category.id)
+        .scalar_subquery()
+    )
+    published = (
+        select(func.count(Blog.id))
+        .where(Blog.category_id == Category.id, Blog.status == "PUBLISHED")
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        sql_update(Category)
+        .values(posts_count=total, published_posts_count=published)
+        .execution_options(synchronize_session=False)
     )
-    count_map = {category_id: total for category_id, total in counts}
-    for category in categories:
-        category.posts_count = int(count_map.get(category.id, 0))
-    return categories
+    await db.commit()
+    return result.rowcount
 
 
-def create(db: Session, data: CategoryCreate) -> Category:
+async def create(db: AsyncSession, data: CategoryCreate) -> Category:
     category = Category(name=data.name.strip())
     db.add(category)
-    db.commit()
-    db.refresh(category)
+    await db.commit()
+    await db.refresh(category)
     return category
 
 
-def update(db: Session, category: Category, data: CategoryUpdate) -> Category:
+async def update(db: AsyncSession, category: Category, data: CategoryUpdate) -> Category:
     if data.name is not None:
         category.name = data.name.strip()
     db.add(category)
-    db.commit()
-    db.refresh(category)
+    await db.commit()
+    await db.refresh(category)
     return category
 
 
-def delete(db: Session, category: Category) -> None:
-    db.delete(category)
-    db.commit()
+async def delete(db: AsyncSession, category: Category) -> None:
+    await db.delete(category)
+    await db.commit()
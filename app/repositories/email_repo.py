@@ -1,22 +1,100 @@
-from datetime import datetime, timezone
-from sqlalchemy.orm import Session
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.models.email_log import EmailLog
 
 
-def create_log(db: Session, to_email: str, subject: str, body: str) -> EmailLog:
-    log = EmailLog(to_email=to_email, subject=subject, body=body, status="QUEUED")
+def add_queued(
+    db: AsyncSession,
+    to_email: str,
+    subject: str,
+    body: str,
+    html_body: str | None = None,
+    cc_emails: list[str] | None = None,
+) -> EmailLog:
+    log = EmailLog(
+        to_email=to_email,
+        subject=subject,
+        body=body,
+        html_body=html_body,
+        cc_emails=cc_emails or None,
+        status="QUEUED",
+        attempts=0,
+    )
     db.add(log)
-    db.commit()
-    db.refresh(log)
     return log
 
 
-def update_log(db: Session, log: EmailLog, status: str, error_message: str | None = None) -> EmailLog:
+async def create_log(
+    db: AsyncSession,
+    to_email: str,
+    subject: str,
+    body: str,
+    html_body: str | None = None,
+    cc_emails: list[str] | None = None,
+) -> EmailLog:
+    log = add_queued(db, to_email, subject, body, html_body=html_body, cc_emails=cc_emails)
+    await db.commit()
+    await db.refresh(log)
+    return log
+
+
+async def update_log(db: AsyncSession, log: EmailLog, status: str, error_message: str | None = None) -> EmailLog:
     log.status = status
     log.error_message = error_message
     if status == "SENT":
         log.sent_at = datetime.now(timezone.utc)
     db.add(log)
-    db.commit()
-    db.refresh(log)
+    await db.commit()
+    await db.refresh(log)
     return log
+
+
+async def claim_due(db: AsyncSession, limit: int, lease_seconds: int) -> list[EmailLog]:
+    now = datetime.now(timezone.utc)
+    stmt = (
+        select(EmailLog)
+        .where(
+            or_(
+                and_(
+                    EmailLog.status == "QUEUED",
+                    or_(EmailLog.next_attempt_at.is_(None), EmailLog.next_attempt_at <= now),
+                ),
+                and_(EmailLog.status == "SENDING", EmailLog.next_attempt_at <= now),
+            )
+        )
+        .order_by(EmailLog.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    logs = list(await db.scalars(stmt))
+    for log in logs:
+        log.status = "SENDING"
+        log.attempts = (log.attempts or 0) + 1
+        log.next_attempt_at = now + timedelta(seconds=lease_seconds)
+    await db.commit()
+    return logs
+
+
+async def record_deliveries(
+    db: AsyncSession,
+    outcomes: list[tuple[EmailLog, str | None]],
+    max_attempts: int,
+    retry_delay: Callable[[int], timedelta],
+) -> None:
+    now = datetime.now(timezone.utc)
+    for log, error in outcomes:
+        log = await db.merge(log, load=False)
+        log.error_message = error
+        if error is None:
+            log.status = "SENT"
+            log.sent_at = now
+            log.next_attempt_at = None
+        elif log.attempts >= max_attempts:
+            log.status = "FAILED"
+            log.next_attempt_at = None
+        else:
+            log.status = "QUEUED"
+            log.next_attempt_at = now + retry_delay(log.attempts)
+    await db.commit()
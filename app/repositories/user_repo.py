@@ -1,32 +1,35 @@
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.principal import invalidate_principal
 from app.db.models.user import User
 
 
-def get_by_email(db: Session, email: str) -> User | None:
-    return db.query(User).filter(User.email == email).first()
+async def get_by_email(db: AsyncSession, email: str) -> User | None:
+    return await db.scalar(select(User).where(User.email == email).limit(1))
 
 
-def get_by_id(db: Session, user_id: UUID) -> User | None:
-    return db.get(User, user_id)
+async def get_by_id(db: AsyncSession, user_id: UUID) -> User | None:
+    return await db.get(User, user_id)
 
 
-def create_user(
-    db: Session,
+async def create_user(
+    db: AsyncSession,
     email: str,
     password_hash: str,
     role: str = "USER",
 ) -> User:
     user = User(email=email, password_hash=password_hash, role=role)
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 
-def update_password(db: Session, user: User, password_hash: str) -> User:
+async def update_password(db: AsyncSession, user: User, password_hash: str) -> User:
     user.password_hash = password_hash
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    invalidate_principal(user.id)
     return user
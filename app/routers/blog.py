@@ -1,17 +1,19 @@
-import uuid
 from pathlib import Path
 from uuid import UUID
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from urllib.parse import urlparse
 
 from app.core.config import settings
-from app.core.deps import get_db, require_role
-from app.db.models.user import User
+from app.core.deps import get_db, require_role, require_role_claim
+from app.core.principal import Principal
+from app.core.responses import json_response
+from app.core.uploads import save_image
 from app.schemas.auth import MessageOut
-from app.schemas.blog import BlogCreate, BlogOut, BlogUpdate
-from app.services import blog_service
-from app.repositories import category_repo
+from app.schemas.blog import BlogCreate, BlogOut, BlogSummaryOut, BlogUpdate
+from app.services import blog_service, image_variants
+from app.repositories import blog_repo, category_repo
 
 router = APIRouter(prefix="/blogs", tags=["blogs"])
 
@@ -19,21 +21,7 @@ router = APIRouter(prefix="/blogs", tags=["blogs"])
 def _save_image(file: UploadFile) -> str:
     if not file.filename:
         raise HTTPException(status_code=400, detail="Invalid image file")
-    ext = Path(file.filename).suffix.lower()
-    if ext not in {".png", ".jpg", ".jpeg"}:
-        raise HTTPException(status_code=400, detail="Unsupported image type")
-    content = file.file.read()
-    if len(content) > 5 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="Image must be 5 MB or smaller")
-
-    media_root = Path(settings.MEDIA_DIR) / "blogs"
-    media_root.mkdir(parents=True, exist_ok=True)
-
-    filename = f"{uuid.uuid4().hex}{ext}"
-    file_path = media_root / filename
-    with file_path.open("wb") as buffer:
-        buffer.write(content)
-
+    filename = save_image(file.file, Path(settings.MEDIA_DIR) / "blogs", settings.IMAGE_MAX_BYTES)
     return f"/media/blogs/{filename}"
 
 
@@ -60,24 +48,40 @@ def _normalize_image_url(image_url: str | None) -> str | None:
     raise HTTPException(status_code=400, detail="Image URL must be a valid http(s) URL or a /media path")
 
 
-@router.get("", response_model=list[BlogOut])
-@router.get("/", response_model=list[BlogOut])
-def list_blogs(
+@router.get("", response_model=list[BlogOut] | list[BlogSummaryOut])
+@router.get("/", response_model=list[BlogOut] | list[BlogSummaryOut])
+async def list_blogs(
+    response: Response,
     skip: int = 0,
     limit: int = 12,
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
-) -> list[BlogOut]:
-    return blog_service.list_blogs(db, skip=skip, limit=limit)
+    cursor: str | None = None,
+    include: str | None = None,
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role_claim("ADMIN")),
+) -> Response:
+    include_content = blog_service.includes_content(include)
+    try:
+        blogs = await blog_service.list_blogs(
+            db,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            include_content=include_content,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if blogs and len(blogs) == limit:
+        response.headers["X-Next-Cursor"] = blog_repo.blog_cursor(blogs[-1])
+    return json_response(blog_service.list_schema(include_content), blogs, response)
 
 
 @router.get("/{blog_id}", response_model=BlogOut)
-def get_blog(
+async def get_blog(
     blog_id: UUID,
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role_claim("ADMIN")),
 ) -> BlogOut:
-    blog = blog_service.get_blog(db, blog_id)
+    blog = await blog_service.get_blog(db, blog_id)
     if not blog:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Blog not found")
     return blog
@@ -85,23 +89,24 @@ def get_blog(
 
 @router.post("", response_model=BlogOut, status_code=status.HTTP_201_CREATED)
 @router.post("/", response_model=BlogOut, status_code=status.HTTP_201_CREATED)
-def create_blog(
+async def create_blog(
+    background_tasks: BackgroundTasks,
     title: str = Form(...),
     content_html: str = Form(...),
     category_id: UUID = Form(...),
     status_value: str = Form("DRAFT"),
     image_url: str | None = Form(None),
     image_file: UploadFile | None = File(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_role("ADMIN")),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_role("ADMIN")),
 ) -> BlogOut:
-    category = category_repo.get_by_id(db, category_id)
+    category = await category_repo.get_by_id(db, category_id)
     if not category:
         raise HTTPException(status_code=400, detail="Invalid category")
 
     final_image_url = _normalize_image_url(image_url)
     if image_file is not None:
-        final_image_url = _save_image(image_file)
+        final_image_url = await run_in_threadpool(_save_image, image_file)
     if not final_image_url:
         raise HTTPException(status_code=400, detail="Feature image is required")
 
@@ -113,33 +118,37 @@ def create_blog(
         image_url=final_image_url,
         posted_by="Dr. Prem Thurairajah",
     )
-    return blog_service.create_blog(db, current_user.id, payload)
+    blog = await blog_service.create_blog(db, current_user.id, payload)
+    if image_variants.source_path(blog.image_url):
+        background_tasks.add_task(image_variants.process_blog_image, blog.image_url)
+    return blog
 
 
 @router.put("/{blog_id}", response_model=BlogOut)
-def update_blog(
+async def update_blog(
     blog_id: UUID,
+    background_tasks: BackgroundTasks,
     title: str | None = Form(None),
     content_html: str | None = Form(None),
     category_id: UUID | None = Form(None),
     status_value: str | None = Form(None),
     image_url: str | None = Form(None),
     image_file: UploadFile | None = File(None),
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role("ADMIN")),
 ) -> BlogOut:
-    blog = blog_service.get_blog(db, blog_id)
+    blog = await blog_service.get_blog(db, blog_id)
     if not blog:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Blog not found")
 
     if category_id is not None:
-        category = category_repo.get_by_id(db, category_id)
+        category = await category_repo.get_by_id(db, category_id)
         if not category:
             raise HTTPException(status_code=400, detail="Invalid category")
 
     final_image_url = _normalize_image_url(image_url)
     if image_file is not None:
-        final_image_url = _save_image(image_file)
+        final_image_url = await run_in_threadpool(_save_image, image_file)
 
     payload = BlogUpdate(
         title=title,
@@ -148,17 +157,21 @@ def update_blog(
         status=status_value,
         image_url=final_image_url,
     )
-    return blog_service.update_blog(db, blog, payload)
+    previous_image_url = blog.image_url
+    updated = await blog_service.update_blog(db, blog, payload)
+    if updated.image_url != previous_image_url and image_variants.source_path(updated.image_url):
+        background_tasks.add_task(image_variants.process_blog_image, updated.image_url)
+    return updated
 
 
 @router.delete("/{blog_id}", response_model=MessageOut)
-def delete_blog(
+async def delete_blog(
     blog_id: UUID,
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role("ADMIN")),
 ) -> MessageOut:
-    blog = blog_service.get_blog(db, blog_id)
+    blog = await blog_service.get_blog(db, blog_id)
     if not blog:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Blog not found")
-    blog_service.delete_blog(db, blog)
+    await blog_service.delete_blog(db, blog)
     return MessageOut(message="Blog deleted.")
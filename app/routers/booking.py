@@ -1,9 +1,10 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_db, require_role
-from app.db.models.user import User
+from app.core.deps import get_db, require_role, require_role_claim
+from app.core.principal import Principal
+from app.core.responses import json_response
 from app.schemas.auth import MessageOut
 from app.schemas.booking import BookingCreate, BookingOut
 from app.services import booking_service
@@ -12,22 +13,23 @@ router = APIRouter(prefix="/bookings", tags=["bookings"])
 
 
 @router.get("/", response_model=list[BookingOut])
-def list_bookings(
+async def list_bookings(
     skip: int = 0,
     limit: int = 12,
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
-) -> list[BookingOut]:
-    return booking_service.list_bookings(db, skip=skip, limit=limit)
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role_claim("ADMIN")),
+) -> Response:
+    bookings = await booking_service.list_bookings(db, skip=skip, limit=limit)
+    return json_response(list[BookingOut], bookings)
 
 
 @router.get("/{booking_id}", response_model=BookingOut)
-def get_booking(
+async def get_booking(
     booking_id: UUID,
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role_claim("ADMIN")),
 ) -> BookingOut:
-    booking = booking_service.get_booking(db, booking_id)
+    booking = await booking_service.get_booking(db, booking_id)
     if not booking:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
     return booking
@@ -37,20 +39,20 @@ def get_booking(
 async def create_booking(
     payload: BookingCreate,
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> MessageOut:
     await booking_service.create_booking(db, payload, request.client.host if request.client else None)
     return MessageOut(message="Booking request received.")
 
 
 @router.delete("/{booking_id}", response_model=MessageOut)
-def delete_booking(
+async def delete_booking(
     booking_id: UUID,
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role("ADMIN")),
 ) -> MessageOut:
-    booking = booking_service.get_booking(db, booking_id)
+    booking = await booking_service.get_booking(db, booking_id)
     if not booking:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
-    booking_service.delete_booking(db, booking)
+    await booking_service.delete_booking(db, booking)
     return MessageOut(message="Booking deleted.")
@@ -1,9 +1,10 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.deps import get_db, require_role
-from app.db.models.user import User
+from app.core.deps import get_db, require_role, require_role_claim
+from app.core.principal import Principal
+from app.core.responses import json_response
 from app.schemas.auth import MessageOut
 from app.schemas.category import CategoryCreate, CategoryOut, CategoryUpdate
 from app.services import category_service
@@ -12,55 +13,56 @@ router = APIRouter(prefix="/categories", tags=["categories"])
 
 
 @router.get("/", response_model=list[CategoryOut])
-def list_categories(
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
-) -> list[CategoryOut]:
-    return category_service.list_categories(db)
+async def list_categories(
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role_claim("ADMIN")),
+) -> Response:
+    categories = await category_service.list_categories(db)
+    return json_response(list[CategoryOut], categories)
 
 
 @router.get("/{category_id}", response_model=CategoryOut)
-def get_category(
+async def get_category(
     category_id: UUID,
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role_claim("ADMIN")),
 ) -> CategoryOut:
-    category = category_service.get_category(db, category_id)
+    category = await category_service.get_category(db, category_id)
     if not category:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
     return category
 
 
 @router.post("/", response_model=CategoryOut, status_code=status.HTTP_201_CREATED)
-def create_category(
+async def create_category(
     payload: CategoryCreate,
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role("ADMIN")),
 ) -> CategoryOut:
-    return category_service.create_category(db, payload)
+    return await category_service.create_category(db, payload)
 
 
 @router.put("/{category_id}", response_model=CategoryOut)
-def update_category(
+async def update_category(
     category_id: UUID,
     payload: CategoryUpdate,
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role("ADMIN")),
 ) -> CategoryOut:
-    category = category_service.get_category(db, category_id)
+    category = await category_service.get_category(db, category_id)
     if not category:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
-    return category_service.update_category(db, category, payload)
+    return await category_service.update_category(db, category, payload)
 
 
 @router.delete("/{category_id}", response_model=MessageOut)
-def delete_category(
+async def delete_category(
     category_id: UUID,
-    db: Session = Depends(get_db),
-    _: User = Depends(require_role("ADMIN")),
+    db: AsyncSession = Depends(get_db),
+    _: Principal = Depends(require_role("ADMIN")),
 ) -> MessageOut:
-    category = category_service.get_category(db, category_id)
+    category = await category_service.get_category(db, category_id)
     if not category:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Category not found")
-    category_service.delete_category(db, category)
+    await category_service.delete_category(db, category)
     return MessageOut(message="Category deleted.")
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends
+
+from app.core import compression
+from app.core.cache import public_cache
+from app.core.config import settings
+from app.core.deps import require_role_claim
+from app.core.principal import Principal
+from app.core.security import password_hasher
+from app.db.pool_metrics import pool_metrics
+from app.db.session import MAX_OVERFLOW, POOL_SIZE, engine
+from app.services import recaptcha_service
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/cache")
+async def cache_metrics(_: Principal = Depends(require_role_claim("ADMIN"))) -> dict[str, int | float]:
+    return public_cache.stats()
+
+
+@router.get("/db-pool")
+async def db_pool_metrics(_: Principal = Depends(require_role_claim("ADMIN"))) -> dict:
+    stats = pool_metrics.snapshot(engine.pool)
+    stats.update(
+        {
+            "configured_size": POOL_SIZE,
+            "max_overflow": MAX_OVERFLOW,
+            "recycle_seconds": settings.DB_POOL_RECYCLE,
+            "pre_ping": settings.DB_POOL_PRE_PING,
+        }
+    )
+    return stats
+
+
+@router.get("/password-hashing")
+async def password_hashing_metrics(_: Principal = Depends(require_role_claim("ADMIN"))) -> dict:
+    return password_hasher.stats()
+
+
+@router.get("/recaptcha")
+async def recaptcha_metrics(_: Principal = Depends(require_role_claim("ADMIN"))) -> dict:
+    return recaptcha_service.stats()
+
+
+@router.get("/compression")
+async def compression_metrics(_: Principal = Depends(require_role_claim("ADMIN"))) -> dict:
+    return compression.stats()
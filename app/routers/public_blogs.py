@@ -1,46 +1,95 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.conditional import conditional_response
 from app.core.config import settings
 from app.core.deps import get_db
 from app.core.rate_limit import RateLimiter, get_client_ip
+from app.core.responses import json_response
 from app.repositories import blog_repo
-from app.schemas.blog import BlogOut
+from app.schemas.blog import BlogOut, BlogSummaryOut
+from app.services import blog_service
 
 router = APIRouter(prefix="/public/blogs", tags=["public-blogs"])
 
 _public_blog_limiter = RateLimiter(
+    name="public_blogs",
     max_attempts=settings.PUBLIC_BLOG_MAX_ATTEMPTS,
     window_seconds=settings.PUBLIC_BLOG_WINDOW_SECONDS,
     error_detail="Rate limit exceeded",
 )
 
 
-def rate_limit(request: Request) -> None:
+async def rate_limit(request: Request) -> None:
     ip = get_client_ip(request)
-    _public_blog_limiter.hit(ip)
+    await _public_blog_limiter.hit(ip)
 
 
-@router.get("/", response_model=list[BlogOut])
-def list_published_blogs(
+@router.get("/", response_model=list[BlogOut] | list[BlogSummaryOut])
+async def list_published_blogs(
     request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 12,
-    db: Session = Depends(get_db),
-) -> list[BlogOut]:
-    rate_limit(request)
-    return blog_repo.list_published_blogs(db, skip=skip, limit=limit)
+    cursor: str | None = None,
+    include: str | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    await rate_limit(request)
+    include_content = blog_service.includes_content(include)
+    try:
+        page = await blog_service.list_published_blogs(
+            db,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            include_content=include_content,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    not_modified = conditional_response(request, response, page.etag, page.last_modified)
+    if not_modified:
+        return not_modified
+    blogs = page.value
+    if blogs and len(blogs) == limit:
+        response.headers["X-Next-Cursor"] = blog_repo.published_blog_cursor(blogs[-1])
+    return json_response(blog_service.list_schema(include_content), blogs, response)
+
+
+@router.get("/search", response_model=list[BlogOut] | list[BlogSummaryOut])
+async def search_published_blogs(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(12, ge=1, le=50),
+    include: str | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    await rate_limit(request)
+    include_content = blog_service.includes_content(include)
+    blogs = await blog_service.search_published_blogs(
+        db,
+        q,
+        skip=skip,
+        limit=limit,
+        include_content=include_content,
+    )
+    return json_response(blog_service.list_schema(include_content), blogs)
 
 
 @router.get("/{blog_id}", response_model=BlogOut)
-def get_published_blog(
+async def get_published_blog(
     blog_id: UUID,
     request: Request,
-    db: Session = Depends(get_db),
-) -> BlogOut:
-    rate_limit(request)
-    blog = blog_repo.get_published_blog(db, blog_id)
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    await rate_limit(request)
+    blog = await blog_service.get_published_blog(db, blog_id)
     if not blog:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Blog not found")
-    return blog
+    not_modified = conditional_response(request, response, blog.etag, blog.last_modified)
+    if not_modified:
+        return not_modified
+    return json_response(BlogOut, blog.value, response)
@@ -1,13 +1,23 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.conditional import conditional_response
 from app.core.deps import get_db
+from app.core.responses import json_response
 from app.schemas.category import CategoryOut
-from app.repositories import category_repo
+from app.services import category_service
 
 router = APIRouter(prefix="/public/categories", tags=["public-categories"])
 
 
 @router.get("/", response_model=list[CategoryOut])
-def list_categories(db: Session = Depends(get_db)) -> list[CategoryOut]:
-    return category_repo.list_categories(db)
+async def list_categories(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    categories = await category_service.list_public_categories(db)
+    not_modified = conditional_response(request, response, categories.etag, categories.last_modified)
+    if not_modified:
+        return not_modified
+    return json_response(list[CategoryOut], categories.value, response)
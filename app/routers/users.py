@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_current_user, get_db
-from app.core.security import hash_password
-from app.db.models.user import User
+from app.core.principal import Principal
+from app.core.security import password_hasher
 from app.schemas.user import PasswordUpdateIn, UserOut
 from app.repositories import user_repo
 
@@ -11,20 +11,23 @@ router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("/me", response_model=UserOut)
-def read_me(current_user: User = Depends(get_current_user)) -> UserOut:
+async def read_me(current_user: Principal = Depends(get_current_user)) -> UserOut:
     return current_user
 
 
 @router.put("/me/password")
-def update_password(
+async def update_password(
     payload: PasswordUpdateIn,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
 ) -> dict[str, str]:
     if len(payload.new_password) < 8:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Password must be at least 8 characters")
     if payload.new_password != payload.confirm_password:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Passwords do not match")
 
-    user_repo.update_password(db, current_user, hash_password(payload.new_password))
+    user = await user_repo.get_by_id(db, current_user.id)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
+    await user_repo.update_password(db, user, await password_hasher.hash(payload.new_password))
     return {"message": "Password updated."}
@@ -20,12 +20,12 @@ class BlogUpdate(BaseModel):
     image_url: str | None = None
 
 
-class BlogOut(BaseModel):
+class BlogSummaryOut(BaseModel):
     id: UUID
     title: str
-    content_html: str
     status: str
     image_url: str | None = None
+    image_variants: dict[str, dict[str, str | int]] | None = None
     posted_by: str
     category_id: UUID
     author_id: UUID
@@ -35,3 +35,7 @@ class BlogOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class BlogOut(BlogSummaryOut):
+    content_html: str
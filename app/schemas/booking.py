@@ -17,7 +17,7 @@ class BookingCreate(BaseModel):
 class BookingOut(BaseModel):
     id: UUID
     name: str
-    email: EmailStr
+    email: str
     phone: str | None = None
     preferred_date: date | None = None
     preferred_time: str | None = None
@@ -14,6 +14,7 @@ class CategoryOut(BaseModel):
     id: UUID
     name: str
     posts_count: int
+    published_posts_count: int
 
     class Config:
         from_attributes = True
@@ -1,35 +1,34 @@
 from uuid import UUID
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.security import (
     create_password_reset_token,
-    hash_password,
-    verify_password,
+    password_hasher,
     verify_password_reset_token,
 )
 from app.db.models.user import User
 from app.repositories import user_repo
 
 
-def authenticate_user(db: Session, email: str, password: str) -> User:
-    user = user_repo.get_by_email(db, email)
-    if not user or not verify_password(password, user.password_hash):
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> User:
+    user = await user_repo.get_by_email(db, email)
+    if not user or not await password_hasher.verify(password, user.password_hash):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User is inactive")
     return user
 
 
-def ensure_default_admin(db: Session) -> User | None:
+async def ensure_default_admin(db: AsyncSession) -> User | None:
     if not settings.ADMIN_SEED_EMAIL or not settings.ADMIN_SEED_PASSWORD:
         return None
-    user = user_repo.get_by_email(db, settings.ADMIN_SEED_EMAIL)
+    user = await user_repo.get_by_email(db, settings.ADMIN_SEED_EMAIL)
     if user:
         return user
-    password_hash = hash_password(settings.ADMIN_SEED_PASSWORD)
-    return user_repo.create_user(
+    password_hash = await password_hasher.hash(settings.ADMIN_SEED_PASSWORD)
+    return await user_repo.create_user(
         db,
         settings.ADMIN_SEED_EMAIL,
         password_hash,
@@ -37,15 +36,15 @@ def ensure_default_admin(db: Session) -> User | None:
     )
 
 
-def request_password_reset(db: Session, email: str) -> tuple[User, str] | None:
-    user = user_repo.get_by_email(db, email)
+async def request_password_reset(db: AsyncSession, email: str) -> tuple[User, str] | None:
+    user = await user_repo.get_by_email(db, email)
     if not user or not user.is_active:
         return None
     token = create_password_reset_token(str(user.id))
     return user, token
 
 
-def reset_password(db: Session, token: str, new_password: str) -> None:
+async def reset_password(db: AsyncSession, token: str, new_password: str) -> None:
     if len(new_password) < 8:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Password must be at least 8 characters")
     try:
@@ -53,8 +52,8 @@ def reset_password(db: Session, token: str, new_password: str) -> None:
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
-    user = user_repo.get_by_id(db, user_id)
+    user = await user_repo.get_by_id(db, user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    user_repo.update_password(db, user, hash_password(new_password))
+    await user_repo.update_password(db, user, await password_hasher.hash(new_password))
@@ -1,13 +1,21 @@
 from datetime import datetime, timezone
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.repositories import blog_repo
-from app.schemas.blog import BlogCreate, BlogUpdate
+from app.core.cache import public_cache
+from app.core.conditional import Versioned, make_etag
+from app.core.responses import validate
+from app.repositories import blog_repo, category_repo
+from app.schemas.blog import BlogCreate, BlogOut, BlogSummaryOut, BlogUpdate
 from app.db.models.blog import Blog
+from app.services import category_service, search_service
 
 ALLOWED_STATUSES = {"DRAFT", "PUBLISHED"}
 
+PUBLIC_BLOG_LIST_CACHE = "public_blogs:list"
+PUBLIC_BLOG_DETAIL_CACHE = "public_blogs:detail"
+PUBLIC_BLOG_SEARCH_CACHE = "public_blogs:search"
+
 
 def _normalize_status(value: str | None) -> str | None:
     if value is None:
@@ -18,37 +26,187 @@ def _normalize_status(value: str | None) -> str | None:
     return status_value
 
 
-def create_blog(db: Session, author_id, data: BlogCreate) -> Blog:
+def _invalidate_public_blog(blog_id) -> None:
+    public_cache.invalidate_namespace(PUBLIC_BLOG_LIST_CACHE)
+    public_cache.invalidate_namespace(PUBLIC_BLOG_SEARCH_CACHE)
+    public_cache.invalidate((PUBLIC_BLOG_DETAIL_CACHE, blog_id))
+
+
+async def _move_post_counts(
+    db: AsyncSession,
+    previous_category_id,
+    was_published: bool,
+    category_id,
+    is_published: bool,
+) -> bool:
+    if previous_category_id == category_id:
+        published_delta = int(is_published) - int(was_published)
+        await category_repo.adjust_post_counts(db, category_id, published_delta=published_delta)
+        return published_delta != 0
+    await category_repo.adjust_post_counts(db, previous_category_id, -1, -int(was_published))
+    await category_repo.adjust_post_counts(db, category_id, 1, int(is_published))
+    return True
+
+
+async def create_blog(db: AsyncSession, author_id, data: BlogCreate) -> Blog:
     status_value = _normalize_status(data.status) or "DRAFT"
     data.status = status_value
-    blog = blog_repo.create(db, author_id, data)
+    await category_repo.adjust_post_counts(db, data.category_id, 1, int(status_value == "PUBLISHED"))
+    dialect_name = db.get_bind().dialect.name
+    search_vector = search_service.search_vector(dialect_name, data.title, data.content_html)
+    blog = await blog_repo.create(db, author_id, data, search_vector=search_vector)
     if blog.status == "PUBLISHED" and blog.published_at is None:
         blog.published_at = datetime.now(timezone.utc)
         db.add(blog)
-        db.commit()
-        db.refresh(blog)
+        await db.commit()
+        await db.refresh(blog)
+    if not search_service.uses_tsvector(dialect_name):
+        search_service.index_blog(blog, search_vector)
+    if blog.status == "PUBLISHED":
+        _invalidate_public_blog(blog.id)
+    category_service.invalidate_public_categories()
     return blog
 
 
-def list_blogs(db: Session, skip: int = 0, limit: int = 12) -> list[Blog]:
-    return blog_repo.list_blogs(db, skip=skip, limit=limit)
+async def list_blogs(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 12,
+    cursor: str | None = None,
+    include_content: bool = False,
+) -> list[Blog]:
+    return await blog_repo.list_blogs(db, skip=skip, limit=limit, cursor=cursor, include_content=include_content)
+
+
+def includes_content(include: str | None) -> bool:
+    if not include:
+        return False
+    return "content" in {part.strip().lower() for part in include.split(",")}
+
+
+def to_list_out(blogs: list[Blog], include_content: bool) -> list[BlogOut] | list[BlogSummaryOut]:
+    return validate(list_schema(include_content), blogs)
+
+
+def list_schema(include_content: bool) -> type[list[BlogOut]] | type[list[BlogSummaryOut]]:
+    return list[BlogOut] if include_content else list[BlogSummaryOut]
+
 
+async def list_published_blogs(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 12,
+    cursor: str | None = None,
+    include_content: bool = False,
+) -> Versioned[list[BlogOut] | list[BlogSummaryOut]]:
+    skip = 0 if cursor else skip
 
-def get_blog(db: Session, blog_id) -> Blog | None:
-    return blog_repo.get(db, blog_id)
+    async def _load() -> Versioned[list[BlogOut] | list[BlogSummaryOut]]:
+        last_updated, total = await blog_repo.published_blogs_version(db)
+        blogs = await blog_repo.list_published_blogs(
+            db,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            include_content=include_content,
+        )
+        etag = make_etag("public-blogs", last_updated, total, skip, limit, cursor, include_content)
+        return Versioned(to_list_out(blogs, include_content), etag, last_updated)
 
+    key = (PUBLIC_BLOG_LIST_CACHE, skip, limit, cursor, include_content)
+    return await public_cache.get_or_load(key, _load)
 
-def update_blog(db: Session, blog: Blog, data: BlogUpdate) -> Blog:
+
+async def search_published_blogs(
+    db: AsyncSession,
+    query: str,
+    skip: int = 0,
+    limit: int = 12,
+    include_content: bool = False,
+) -> list[BlogOut] | list[BlogSummaryOut]:
+    async def _load() -> list[BlogOut] | list[BlogSummaryOut]:
+        if search_service.uses_tsvector(db.get_bind().dialect.name):
+            blogs = await blog_repo.search_published_blogs(
+                db,
+                search_service.tsquery(query),
+                skip=skip,
+                limit=limit,
+                include_content=include_content,
+            )
+        else:
+            await search_service.inverted_index.ensure_built(db)
+            blog_ids = search_service.inverted_index.search(query, skip, limit)
+            blogs = await blog_repo.list_published_by_ids(db, blog_ids, include_content=include_content)
+        return to_list_out(blogs, include_content)
+
+    key = (PUBLIC_BLOG_SEARCH_CACHE, " ".join(query.lower().split()), skip, limit, include_content)
+    return await public_cache.get_or_load(key, _load)
+
+
+async def get_published_blog(db: AsyncSession, blog_id) -> Versioned[BlogOut] | None:
+    async def _load() -> Versioned[BlogOut] | None:
+        blog = await blog_repo.get_published_blog(db, blog_id)
+        if blog is None:
+            return None
+        etag = make_etag("public-blog", blog_id, blog.updated_at)
+        return Versioned(BlogOut.model_validate(blog), etag, blog.updated_at)
+
+    return await public_cache.get_or_load((PUBLIC_BLOG_DETAIL_CACHE, blog_id), _load)
+
+
+async def get_blog(db: AsyncSession, blog_id) -> Blog | None:
+    return await blog_repo.get(db, blog_id)
+
+
+async def update_blog(db: AsyncSession, blog: Blog, data: BlogUpdate) -> Blog:
     status_value = _normalize_status(data.status)
     data.status = status_value if status_value is not None else data.status
-    updated = blog_repo.update(db, blog, data)
+    was_published = blog.status == "PUBLISHED"
+    previous_category_id = blog.category_id
+    counts_changed = await _move_post_counts(
+        db,
+        previous_category_id,
+        was_published,
+        data.category_id or previous_category_id,
+        (data.status or blog.status) == "PUBLISHED",
+    )
+    dialect_name = db.get_bind().dialect.name
+    search_vector = None
+    if data.title is not None or data.content_html is not None:
+        search_vector = search_service.search_vector(
+            dialect_name,
+            data.title if data.title is not None else blog.title,
+            data.content_html if data.content_html is not None else blog.content_html,
+        )
+    updated = await blog_repo.update(db, blog, data, search_vector=search_vector)
     if updated.status == "PUBLISHED" and updated.published_at is None:
         updated.published_at = datetime.now(timezone.utc)
         db.add(updated)
-        db.commit()
-        db.refresh(updated)
+        await db.commit()
+        await db.refresh(updated)
+    if not search_service.uses_tsvector(dialect_name):
+        search_service.index_blog(updated, search_vector)
+    if was_published or updated.status == "PUBLISHED":
+        _invalidate_public_blog(updated.id)
+    if counts_changed:
+        category_service.invalidate_public_categories()
     return updated
 
 
-def delete_blog(db: Session, blog: Blog) -> None:
-    blog_repo.delete(db, blog)
+async def record_image_variants(db: AsyncSession, image_url: str, variants: dict) -> int:
+    rows = await blog_repo.set_image_variants(db, image_url, variants)
+    for blog_id, status_value in rows:
+        if status_value == "PUBLISHED":
+            _invalidate_public_blog(blog_id)
+    return len(rows)
+
+
+async def delete_blog(db: AsyncSession, blog: Blog) -> None:
+    blog_id = blog.id
+    was_published = blog.status == "PUBLISHED"
+    await category_repo.adjust_post_counts(db, blog.category_id, -1, -int(was_published))
+    await blog_repo.delete(db, blog)
+    search_service.remove_blog(blog_id)
+    if was_published:
+        _invalidate_public_blog(blog_id)
+    category_service.invalidate_public_categories()
@@ -1,33 +1,17 @@
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
-import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.repositories import booking_repo
 from app.schemas.booking import BookingCreate
-from app.services import email_service
+from app.services import email_service, recaptcha_service
 
 
-async def verify_recaptcha(token: str, remote_ip: str | None = None) -> None:
-    if not settings.RECAPTCHA_SECRET:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Recaptcha not configured")
-    payload = {
-        "secret": settings.RECAPTCHA_SECRET,
-        "response": token,
-    }
-    if remote_ip:
-        payload["remoteip"] = remote_ip
-
-    async with httpx.AsyncClient(timeout=10) as client:
-        res = await client.post("https://www.google.com/recaptcha/api/siteverify", data=payload)
-    data = res.json()
-    if not data.get("success"):
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Recaptcha verification failed")
-
-
-async def create_booking(db: Session, data: BookingCreate, remote_ip: str | None = None) -> None:
-    await verify_recaptcha(data.recaptcha_token, remote_ip)
-    booking = booking_repo.create(db, data)
+async def create_booking(db: AsyncSession, data: BookingCreate, remote_ip: str | None = None) -> None:
+    await recaptcha_service.verify(data.recaptcha_token, remote_ip)
+    outbox = email_service.uses_outbox()
+    if not outbox:
+        await booking_repo.create(db, data)
 
     admin_email = settings.BOOKING_ADMIN_EMAIL
     if not admin_email:
@@ -41,14 +25,19 @@ async def create_booking(db: Session, data: BookingCreate, remote_ip: str | None
         ]
 
     subject, text_body, html_body = email_service.build_booking_email(
-        name=booking.name,
-        email=booking.email,
-        phone=booking.phone,
-        preferred_date=booking.preferred_date,
-        preferred_time=booking.preferred_time,
-        preferred_location=booking.preferred_location,
-        message=booking.message,
+        name=data.name.strip(),
+        email=data.email,
+        phone=data.phone,
+        preferred_date=data.preferred_date,
+        preferred_time=data.preferred_time,
+        preferred_location=data.preferred_location,
+        message=data.message,
     )
+    if outbox:
+        email_service.queue_email(db, admin_email, subject, text_body, html_body=html_body, cc_emails=cc_emails)
+        await booking_repo.create(db, data)
+        email_service.notify_outbox()
+        return
     await email_service.send_email(
         db,
         admin_email,
@@ -59,13 +48,13 @@ async def create_booking(db: Session, data: BookingCreate, remote_ip: str | None
     )
 
 
-def list_bookings(db: Session, skip: int = 0, limit: int = 12):
-    return booking_repo.list_bookings(db, skip=skip, limit=limit)
+async def list_bookings(db: AsyncSession, skip: int = 0, limit: int = 12):
+    return await booking_repo.list_bookings(db, skip=skip, limit=limit)
 
 
-def get_booking(db: Session, booking_id):
-    return booking_repo.get_by_id(db, booking_id)
+async def get_booking(db: AsyncSession, booking_id):
+    return await booking_repo.get_by_id(db, booking_id)
 
 
-def delete_booking(db: Session, booking):
-    booking_repo.delete(db, booking)
+async def delete_booking(db: AsyncSession, booking):
+    await booking_repo.delete(db, booking)
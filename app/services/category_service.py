@@ -1,34 +1,58 @@
 from uuid import UUID
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import public_cache
+from app.core.conditional import Versioned, make_etag
+from app.core.responses import validate
 from app.repositories import category_repo
-from app.schemas.category import CategoryCreate, CategoryUpdate
+from app.schemas.category import CategoryCreate, CategoryOut, CategoryUpdate
 from app.db.models.category import Category
 
+PUBLIC_CATEGORIES_CACHE = "public_categories:list"
 
-def list_categories(db: Session) -> list[Category]:
-    return category_repo.list_categories(db)
 
+def invalidate_public_categories() -> None:
+    public_cache.invalidate_namespace(PUBLIC_CATEGORIES_CACHE)
 
-def create_category(db: Session, data: CategoryCreate) -> Category:
-    existing = category_repo.get_by_name(db, data.name)
+
+async def list_categories(db: AsyncSession) -> list[Category]:
+    return await category_repo.list_categories(db)
+
+
+async def list_public_categories(db: AsyncSession) -> Versioned[list[CategoryOut]]:
+    async def _load() -> Versioned[list[CategoryOut]]:
+        last_updated, total = await category_repo.categories_version(db)
+        categories = await category_repo.list_categories(db)
+        etag = make_etag("public-categories", last_updated, total)
+        return Versioned(validate(list[CategoryOut], categories), etag, last_updated)
+
+    return await public_cache.get_or_load((PUBLIC_CATEGORIES_CACHE,), _load)
+
+
+async def create_category(db: AsyncSession, data: CategoryCreate) -> Category:
+    existing = await category_repo.get_by_name(db, data.name)
     if existing:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Category already exists")
-    return category_repo.create(db, data)
+    category = await category_repo.create(db, data)
+    invalidate_public_categories()
+    return category
 
 
-def get_category(db: Session, category_id: UUID) -> Category | None:
-    return category_repo.get_by_id(db, category_id)
+async def get_category(db: AsyncSession, category_id: UUID) -> Category | None:
+    return await category_repo.get_by_id(db, category_id)
 
 
-def update_category(db: Session, category: Category, data: CategoryUpdate) -> Category:
+async def update_category(db: AsyncSession, category: Category, data: CategoryUpdate) -> Category:
     if data.name is not None:
-        existing = category_repo.get_by_name(db, data.name)
+        existing = await category_repo.get_by_name(db, data.name)
         if existing and existing.id != category.id:
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Category already exists")
-    return category_repo.update(db, category, data)
+    updated = await category_repo.update(db, category, data)
+    invalidate_public_categories()
+    return updated
 
 
-def delete_category(db: Session, category: Category) -> None:
-    category_repo.delete(db, category)
+async def delete_category(db: AsyncSession, category: Category) -> None:
+    await category_repo.delete(db, category)
+    invalidate_public_categories()
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import random
+from datetime import timedelta
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.repositories import email_repo
+from app.services import email_service
+
+logger = logging.getLogger(__name__)
+
+_worker: asyncio.Task | None = None
+_stopping = False
+
+
+def retry_delay(attempts: int) -> timedelta:
+    delay = min(settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.EMAIL_OUTBOX_RETRY_MAX_SECONDS)
+    return timedelta(seconds=delay * random.uniform(0.9, 1.1))
+
+
+async def deliver_due(batch_size: int | None = None) -> int:
+    async with SessionLocal() as db:
+        logs = await email_repo.claim_due(
+            db,
+            batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE,
+            settings.EMAIL_OUTBOX_LEASE_SECONDS,
+        )
+    if not logs:
+        return 0
+    try:
+        results = await email_service.deliver_logs(logs)
+    except Exception as exc:
+        results = [exc] * len(logs)
+    errors = [str(error) or type(error).__name__ if error else None for error in results]
+    async with SessionLocal() as db:
+        await email_repo.record_deliveries(
+            db,
+            list(zip(logs, errors)),
+            settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+            retry_delay,
+        )
+    return len(logs)
+
+
+async def run_worker() -> None:
+    while not _stopping:
+        try:
+            claimed = await deliver_due()
+        except Exception:
+            logger.exception("Email outbox delivery failed")
+            claimed = 0
+        if claimed:
+            continue
+        email_service.outbox_wakeup.clear()
+        if _stopping:
+            break
+        try:
+            await asyncio.wait_for(email_service.outbox_wakeup.wait(), timeout=settings.EMAIL_OUTBOX_POLL_SECONDS)
+        except TimeoutError:
+            pass
+
+
+def start_worker() -> None:
+    global _worker, _stopping
+    _stopping = False
+    email_service.outbox_wakeup = asyncio.Event()
+    _worker = asyncio.create_task(run_worker())
+
+
+async def stop_worker(timeout: float) -> None:
+    global _worker, _stopping
+    if _worker is None:
+        return
+    worker, _worker = _worker, None
+    _stopping = True
+    email_service.outbox_wakeup.set()
+    try:
+        await asyncio.wait_for(worker, timeout=timeout)
+    except TimeoutError:
+        logger.warning("Email outbox worker did not finish its batch within %ss; cancelled", timeout)
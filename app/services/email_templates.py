@@ -0,0 +1,27 @@
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, select_autoescape
+
+TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+_env = Environment(
+    loader=FileSystemLoader(TEMPLATE_DIR),
+    autoescape=select_autoescape(enabled_extensions=("html",), default_for_string=False, default=False),
+    undefined=StrictUndefined,
+    keep_trailing_newline=True,
+    auto_reload=False,
+    cache_size=-1,
+)
+
+
+def load_templates() -> int:
+    names = _env.list_templates(extensions=["html", "txt"])
+    for name in names:
+        _env.get_template(name)
+    return len(names)
+
+
+def render(template: str, /, **context) -> tuple[str, str]:
+    text_body = _env.get_template(f"{template}.txt").render(context)
+    html_body = _env.get_template(f"{template}.html").render(context)
+    return text_body, html_body
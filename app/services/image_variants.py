@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:
+    Image = None
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services import blog_service
+
+logger = logging.getLogger(__name__)
+
+MEDIA_PREFIX = "/media/blogs/"
+VARIANTS_DIR = "variants"
+VARIANT_WIDTHS = {"thumb": 320, "card": 768, "full": 1600}
+SOURCE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+_FALLBACK_FORMATS = {".png": ("PNG", "png"), ".jpg": ("JPEG", "jpg"), ".jpeg": ("JPEG", "jpg")}
+_SAVE_OPTIONS = {
+    "JPEG": {"quality": 82, "optimize": True, "progressive": True},
+    "PNG": {"optimize": True},
+    "WEBP": {"quality": 80, "method": 4},
+    "AVIF": {"quality": 60},
+}
+
+
+def available() -> bool:
+    return Image is not None and settings.IMAGE_VARIANTS_ENABLED
+
+
+def source_path(image_url: str | None) -> Path | None:
+    if not image_url or not image_url.startswith(MEDIA_PREFIX):
+        return None
+    name = image_url[len(MEDIA_PREFIX):]
+    if "/" in name or Path(name).suffix.lower() not in SOURCE_SUFFIXES:
+        return None
+    return Path(settings.MEDIA_DIR) / "blogs" / name
+
+
+def _save(image, path: Path, image_format: str) -> None:
+    temp_path = path.with_name(f".{path.name}.part")
+    try:
+        image.save(temp_path, format=image_format, **_SAVE_OPTIONS[image_format])
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def render_variants(source: str) -> dict[str, dict[str, str | int]]:
+    source_file = Path(source)
+    output_dir = source_file.parent / VARIANTS_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    fallback_format, fallback_ext = _FALLBACK_FORMATS[source_file.suffix.lower()]
+    formats = [("WEBP", "webp")]
+    if features.check("avif"):
+        formats.append(("AVIF", "avif"))
+    formats.append((fallback_format, fallback_ext))
+
+    with Image.open(source_file) as opened:
+        image = ImageOps.exif_transpose(opened)
+        if image.mode not in {"RGB", "RGBA"}:
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in {"LA", "P"} else "RGB")
+        for image_format, ext in formats[:-1]:
+            _save(image, source_file.with_suffix(f".{ext}"), image_format)
+        variants: dict[str, dict[str, str | int]] = {}
+        for name, width in VARIANT_WIDTHS.items():
+            resized = image
+            if image.width > width:
+                resized = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+            entry: dict[str, str | int] = {"width": resized.width, "height": resized.height}
+            for image_format, ext in formats:
+                output = resized.convert("RGB") if image_format == "JPEG" and resized.mode != "RGB" else resized
+                filename = f"{source_file.stem}-{name}.{ext}"
+                _save(output, output_dir / filename, image_format)
+                entry[ext] = f"{MEDIA_PREFIX}{VARIANTS_DIR}/{filename}"
+            variants[name] = entry
+    return variants
+
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # Forking a process that already runs the event loop and thread pools is unsafe.
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_VARIANT_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+async def generate(image_url: str | None) -> dict[str, dict[str, str | int]] | None:
+    source = source_path(image_url)
+    if not available() or source is None or not source.is_file():
+        return None
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(get_pool(), render_variants, str(source))
+    except BrokenProcessPool:
+        shutdown_pool()
+        raise
+
+
+async def process_blog_image(image_url: str | None) -> None:
+    try:
+        variants = await generate(image_url)
+        if not variants:
+            return
+        async with SessionLocal() as db:
+            await blog_service.record_image_variants(db, image_url, variants)
+    except Exception:
+        logger.exception("Image variant generation failed for %s", image_url)
@@ -0,0 +1,182 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from email.message import EmailMessage
+
+import aiosmtplib
+
+from app.core.config import settings
+
+_HEALTH_CHECK_AFTER_SECONDS = 2
+_MESSAGE_ERRORS = (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPSenderRefused, aiosmtplib.SMTPDataError)
+_CONNECTION_ERRORS = (OSError,)
+
+
+class SMTPPool:
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        username: str | None,
+        password: str | None,
+        use_tls: bool,
+        start_tls: bool,
+        size: int,
+        idle_seconds: float,
+        timeout: float,
+    ) -> None:
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.start_tls = start_tls
+        self.size = size
+        self.idle_seconds = idle_seconds
+        self.timeout = timeout
+        self._idle: list[tuple[aiosmtplib.SMTP, float]] = []
+        self._slots = asyncio.Semaphore(size)
+        self.connects = 0
+        self.reuses = 0
+        self.discards = 0
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username or None,
+            password=self.password or None,
+            use_tls=self.use_tls,
+            start_tls=self.start_tls,
+            validate_certs=True,
+            timeout=self.timeout,
+        )
+        await client.connect()
+        self.connects += 1
+        return client
+
+    async def _discard(self, client: aiosmtplib.SMTP) -> None:
+        self.discards += 1
+        try:
+            if client.is_connected:
+                await client.quit()
+        except Exception:
+            client.close()
+
+    async def _checkout(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            client, last_used = self._idle.pop()
+            idle_for = time.monotonic() - last_used
+            if idle_for > self.idle_seconds or not client.is_connected:
+                await self._discard(client)
+                continue
+            if idle_for > _HEALTH_CHECK_AFTER_SECONDS:
+                try:
+                    await client.noop()
+                except (aiosmtplib.SMTPException, *_CONNECTION_ERRORS):
+                    await self._discard(client)
+                    continue
+            self.reuses += 1
+            return client
+        return await self._connect()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        async with self._slots:
+            client = await self._checkout()
+            try:
+                yield client
+            except BaseException:
+                await self._discard(client)
+                raise
+            self._idle.append((client, time.monotonic()))
+
+    async def send(self, message: EmailMessage) -> None:
+        error = (await self.send_many([message]))[0]
+        if error is not None:
+            raise error
+
+    async def send_many(self, messages: list[EmailMessage]) -> list[Exception | None]:
+        if len(messages) <= 1 or self.size == 1:
+            return await self._send_in_session(messages)
+        per_session = -(-len(messages) // self.size)
+        chunks = [messages[start:start + per_session] for start in range(0, len(messages), per_session)]
+        results = await asyncio.gather(*(self._send_in_session(chunk) for chunk in chunks))
+        return [result for chunk in results for result in chunk]
+
+    async def _send_in_session(self, messages: list[EmailMessage]) -> list[Exception | None]:
+        results: list[Exception | None] = []
+        retrying = False
+        while len(results) < len(messages):
+            try:
+                async with self.session() as client:
+                    for message in messages[len(results):]:
+                        try:
+                            await client.send_message(message)
+                        except _MESSAGE_ERRORS as exc:
+                            results.append(exc)
+                            await client.rset()
+                        else:
+                            results.append(None)
+                        retrying = False
+            except _CONNECTION_ERRORS as exc:
+                if not retrying:
+                    retrying = True
+                    continue
+                results.extend([exc] * (len(messages) - len(results)))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for client, _ in idle:
+            await self._discard(client)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "connects": self.connects,
+            "reuses": self.reuses,
+            "discards": self.discards,
+        }
+
+
+_pool: SMTPPool | None = None
+
+
+def get_pool() -> SMTPPool:
+    global _pool
+    if _pool is None:
+        missing_settings = [
+            name
+            for name, value in {
+                "MAIL_FROM": settings.MAIL_FROM,
+                "MAIL_SERVER": settings.MAIL_SERVER,
+            }.items()
+            if not value
+        ]
+        if missing_settings:
+            missing = ", ".join(missing_settings)
+            raise RuntimeError(f"Mail settings are not configured: {missing}")
+        _pool = SMTPPool(
+            hostname=settings.MAIL_SERVER,
+            port=settings.MAIL_PORT,
+            username=settings.MAIL_USERNAME,
+            password=settings.MAIL_PASSWORD,
+            use_tls=settings.MAIL_SSL_TLS,
+            start_tls=settings.MAIL_STARTTLS,
+            size=settings.MAIL_POOL_SIZE,
+            idle_seconds=settings.MAIL_POOL_IDLE_SECONDS,
+            timeout=settings.MAIL_TIMEOUT_SECONDS,
+        )
+    return _pool
+
+
+async def close_pool() -> None:
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
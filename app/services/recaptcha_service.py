@@ -0,0 +1,103 @@
+import time
+from collections import Counter
+
+import httpx
+from fastapi import HTTPException, status
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.config import settings
+from app.core.metrics import LatencyStats
+
+breaker = CircuitBreaker(
+    failure_threshold=settings.RECAPTCHA_BREAKER_FAILURES,
+    reset_seconds=settings.RECAPTCHA_BREAKER_RESET_SECONDS,
+)
+latency = LatencyStats()
+outcomes: Counter[str] = Counter()
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                settings.RECAPTCHA_READ_TIMEOUT_SECONDS,
+                connect=settings.RECAPTCHA_CONNECT_TIMEOUT_SECONDS,
+            ),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _unavailable() -> None:
+    if settings.RECAPTCHA_FAIL_OPEN:
+        outcomes["fail_open"] += 1
+        return
+    outcomes["fail_closed"] += 1
+    raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Recaptcha verification unavailable")
+
+
+async def verify(token: str, remote_ip: str | None = None) -> None:
+    if not settings.RECAPTCHA_SECRET:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Recaptcha not configured")
+    if not breaker.allow():
+        outcomes["short_circuited"] += 1
+        _unavailable()
+        return
+
+    payload = {
+        "secret": settings.RECAPTCHA_SECRET,
+        "response": token,
+    }
+    if remote_ip:
+        payload["remoteip"] = remote_ip
+
+    started = time.perf_counter()
+    try:
+        res = await get_client().post(settings.RECAPTCHA_VERIFY_URL, data=payload)
+    except httpx.RequestError:
+        breaker.record_failure()
+        outcomes["upstream_error"] += 1
+        _unavailable()
+        return
+    except BaseException:
+        breaker.release()
+        raise
+    finally:
+        latency.observe(time.perf_counter() - started)
+    if res.is_server_error:
+        breaker.record_failure()
+        outcomes["upstream_error"] += 1
+        _unavailable()
+        return
+    breaker.record_success()
+    try:
+        res.raise_for_status()
+        data = res.json()
+    except (httpx.HTTPStatusError, ValueError):
+        outcomes["upstream_error"] += 1
+        _unavailable()
+        return
+
+    if not data.get("success"):
+        outcomes["rejected"] += 1
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Recaptcha verification failed")
+    outcomes["verified"] += 1
+
+
+def stats() -> dict:
+    return {
+        "latency": latency.snapshot(),
+        "outcomes": dict(outcomes),
+        "circuit": breaker.stats(),
+        "fail_open": settings.RECAPTCHA_FAIL_OPEN,
+    }
@@ -0,0 +1,171 @@
+import asyncio
+import html
+import math
+import re
+import threading
+import time
+from collections import Counter
+from uuid import UUID
+
+from sqlalchemy import cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models.blog import Blog
+
+_TAG = re.compile(r"<[^>]+>")
+_TOKEN = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from if in into is it no not of on or so such "
+    "that the their then there these they this to was will with".split()
+)
+_TITLE_WEIGHT = 3
+
+
+def strip_html(value: str) -> str:
+    return " ".join(html.unescape(_TAG.sub(" ", value)).split())
+
+
+def tokenize(value: str) -> list[str]:
+    return [token for token in _TOKEN.findall(value.lower()) if token not in _STOPWORDS]
+
+
+def uses_tsvector(dialect_name: str) -> bool:
+    return dialect_name == "postgresql"
+
+
+def _weight(label: str):
+    return literal_column(f"'{label}'::\"char\"")
+
+
+def search_vector(dialect_name: str, title: str, content_html: str):
+    if not uses_tsvector(dialect_name):
+        return f"{title}\n{strip_html(content_html)}"
+    config = cast(settings.SEARCH_TEXT_CONFIG, REGCONFIG)
+    return func.setweight(func.to_tsvector(config, title), _weight("A")).op("||")(
+        func.setweight(func.to_tsvector(config, strip_html(content_html)), _weight("B"))
+    )
+
+
+def tsquery(query: str):
+    return func.websearch_to_tsquery(cast(settings.SEARCH_TEXT_CONFIG, REGCONFIG), query)
+
+
+class InvertedIndex:
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[UUID, int]] = {}
+        self._documents: dict[UUID, tuple[Counter[str], int, float]] = {}
+        self._published: set[UUID] = set()
+        self._lock = threading.Lock()
+        self._build_lock = asyncio.Lock()
+        self._built_at = 0.0
+        self.ready = False
+
+    def _remove(self, blog_id: UUID) -> None:
+        document = self._documents.pop(blog_id, None)
+        self._published.discard(blog_id)
+        if document is None:
+            return
+        for token in document[0]:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(blog_id, None)
+                if not postings:
+                    del self._postings[token]
+
+    def replace(self, blog_id: UUID, text: str, published: bool, published_at: float) -> None:
+        title, _, body = text.partition("\n")
+        counts = Counter(tokenize(body))
+        for token in tokenize(title):
+            counts[token] += _TITLE_WEIGHT
+        with self._lock:
+            self._remove(blog_id)
+            self._documents[blog_id] = (counts, sum(counts.values()), published_at)
+            if published:
+                self._published.add(blog_id)
+            for token, count in counts.items():
+                self._postings.setdefault(token, {})[blog_id] = count
+
+    def set_state(self, blog_id: UUID, published: bool, published_at: float) -> None:
+        with self._lock:
+            document = self._documents.get(blog_id)
+            if document is None:
+                return
+            self._documents[blog_id] = (document[0], document[1], published_at)
+            if published:
+                self._published.add(blog_id)
+            else:
+                self._published.discard(blog_id)
+
+    def remove(self, blog_id: UUID) -> None:
+        with self._lock:
+            self._remove(blog_id)
+
+    def search(self, query: str, skip: int, limit: int) -> list[UUID]:
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        with self._lock:
+            postings = sorted((self._postings.get(term, {}) for term in terms), key=len)
+            if not postings[0]:
+                return []
+            total = len(self._documents)
+            scores: list[tuple[float, float, UUID]] = []
+            for blog_id in postings[0]:
+                if blog_id not in self._published or any(blog_id not in other for other in postings[1:]):
+                    continue
+                _, length, published_at = self._documents[blog_id]
+                score = sum(
+                    other[blog_id] * math.log(1 + total / len(other)) for other in postings
+                ) / math.sqrt(length)
+                scores.append((score, published_at, blog_id))
+        scores.sort(key=lambda item: (-item[0], -item[1], str(item[2])))
+        return [blog_id for _, _, blog_id in scores[skip:skip + limit]]
+
+    def _is_current(self) -> bool:
+        return self.ready and time.monotonic() - self._built_at < settings.PUBLIC_CACHE_TTL_SECONDS
+
+    async def ensure_built(self, db: AsyncSession) -> None:
+        if self._is_current():
+            return
+        async with self._build_lock:
+            if self._is_current():
+                return
+            rows = await db.execute(
+                select(Blog.id, Blog.title, Blog.search_vector, Blog.status, Blog.published_at)
+            )
+            fresh = InvertedIndex()
+            for blog_id, title, text, status_value, published_at in rows:
+                fresh.replace(
+                    blog_id,
+                    text or title,
+                    status_value == "PUBLISHED",
+                    published_at.timestamp() if published_at else 0.0,
+                )
+            with self._lock:
+                self._postings, self._documents, self._published = (
+                    fresh._postings,
+                    fresh._documents,
+                    fresh._published,
+                )
+            self._built_at = time.monotonic()
+            self.ready = True
+
+
+inverted_index = InvertedIndex()
+
+
+def index_blog(blog: Blog, text: str | None = None) -> None:
+    if not inverted_index.ready:
+        return
+    published_at = blog.published_at.timestamp() if blog.published_at else 0.0
+    if text is None:
+        inverted_index.set_state(blog.id, blog.status == "PUBLISHED", published_at)
+    else:
+        inverted_index.replace(blog.id, text, blog.status == "PUBLISHED", published_at)
+
+
+def remove_blog(blog_id: UUID) -> None:
+    if inverted_index.ready:
+        inverted_index.remove(blog_id)
@@ -0,0 +1,84 @@
+"""Login latency under concurrent load.
+
+Run against a live server, e.g.:
+
+    uv run uvicorn app.main:app --port 8000
+    uv run python benchmarks/login_bench.py --url http://localhost:8000 --concurrency 32 --requests 500
+
+Each login uses a distinct X-Forwarded-For address so the login rate limiter
+does not ban the benchmark. /health is probed in parallel to show whether the
+event loop stays responsive while passwords are being hashed.
+"""
+
+import argparse
+import asyncio
+import time
+from collections import Counter
+
+import httpx
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000
+
+
+async def _login(client: httpx.AsyncClient, args: argparse.Namespace, index: int) -> tuple[int, float]:
+    started = time.perf_counter()
+    response = await client.post(
+        "/auth/login-json",
+        json={"email": args.email, "password": args.password},
+        headers={"X-Forwarded-For": f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}"},
+    )
+    return response.status_code, time.perf_counter() - started
+
+
+async def _probe_health(client: httpx.AsyncClient, stop: asyncio.Event, samples: list[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get("/health")
+        samples.append(time.perf_counter() - started)
+        await asyncio.sleep(0.05)
+
+
+async def run(args: argparse.Namespace) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency + 1)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def _bounded(index: int) -> tuple[int, float]:
+            async with semaphore:
+                return await _login(client, args, index)
+
+        stop = asyncio.Event()
+        health: list[float] = []
+        probe = asyncio.create_task(_probe_health(client, stop, health))
+        started = time.perf_counter()
+        results = await asyncio.gather(*(_bounded(index) for index in range(args.requests)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe
+
+    statuses = Counter(status for status, _ in results)
+    latencies = [latency for status, latency in results if status == 200]
+    print(f"requests      {args.requests} at concurrency {args.concurrency} in {elapsed:.2f}s")
+    print(f"throughput    {args.requests / elapsed:.1f} req/s")
+    print(f"statuses      {dict(sorted(statuses.items()))}")
+    print(f"login p50/p99 {_percentile(latencies, 0.50):.1f} / {_percentile(latencies, 0.99):.1f} ms")
+    print(f"health p50/p99 {_percentile(health, 0.50):.1f} / {_percentile(health, 0.99):.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--email", default="admin@acorn.com")
+    parser.add_argument("--password", default="Acorn@123")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
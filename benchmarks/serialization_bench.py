@@ -0,0 +1,114 @@
+"""Per-row cost of serializing list responses.
+
+Compares FastAPI's default response path (validate against the response model,
+dump to Python objects, encode with the stdlib-based JSONResponse) with the
+TypeAdapter path used by the list endpoints (validate and dump straight to
+JSON bytes). Rows are transient ORM objects, so no database is needed:
+
+    uv run python benchmarks/serialization_bench.py --rows 12 100 1000
+"""
+
+import argparse
+import timeit
+import uuid
+from datetime import date, datetime, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.responses import dump_json
+from app.db.models.blog import Blog
+from app.db.models.booking import Booking
+from app.db.models.category import Category
+from app.schemas.blog import BlogOut, BlogSummaryOut
+from app.schemas.booking import BookingOut
+from app.schemas.category import CategoryOut
+
+
+def _blogs(count: int) -> list[Blog]:
+    now = datetime.now(timezone.utc)
+    return [
+        Blog(
+            id=uuid.uuid4(),
+            title=f"Post {index}",
+            content_html="<p>" + "Lorem ipsum dolor sit amet. " * 200 + "</p>",
+            status="PUBLISHED",
+            image_url=f"/media/blogs/{uuid.uuid4().hex}.jpg",
+            posted_by="Dr. Prem Thurairajah",
+            category_id=uuid.uuid4(),
+            author_id=uuid.uuid4(),
+            created_at=now,
+            updated_at=now,
+            published_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def _bookings(count: int) -> list[Booking]:
+    return [
+        Booking(
+            id=uuid.uuid4(),
+            name=f"Patient {index}",
+            email=f"patient{index}@example.com",
+            phone="+65 6000 0000",
+            preferred_date=date(2026, 1, 1),
+            preferred_time="10:00",
+            preferred_location="Mount Elizabeth",
+            message="Follow-up consultation",
+            status="NEW",
+            created_at=datetime.now(timezone.utc),
+        )
+        for index in range(count)
+    ]
+
+
+def _categories(count: int) -> list[Category]:
+    return [
+        Category(id=uuid.uuid4(), name=f"Category {index}", posts_count=index, published_posts_count=index)
+        for index in range(count)
+    ]
+
+
+def _run(coroutine):
+    try:
+        coroutine.send(None)
+    except StopIteration as done:
+        return done.value
+    raise RuntimeError("serialize_response awaited unexpectedly")
+
+
+def _fastapi_default(field, rows) -> bytes:
+    content = _run(serialize_response(field=field, response_content=rows))
+    return JSONResponse(content).body
+
+
+def _measure(label: str, schema, rows, number: int) -> None:
+    field = create_model_field("Response", schema, mode="serialization")
+    assert _fastapi_default(field, rows) == dump_json(schema, rows)
+    before = min(timeit.repeat(lambda: _fastapi_default(field, rows), number=number, repeat=5)) / number
+    after = min(timeit.repeat(lambda: dump_json(schema, rows), number=number, repeat=5)) / number
+    per_row_before = before / len(rows) * 1e6
+    per_row_after = after / len(rows) * 1e6
+    print(
+        f"{label:<22} {len(rows):>5} rows  "
+        f"default {per_row_before:7.2f} us/row  fast {per_row_after:7.2f} us/row  "
+        f"{per_row_before / per_row_after:4.1f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[12, 100, 1000])
+    args = parser.parse_args()
+    for count in args.rows:
+        number = max(1, 2000 // count)
+        _measure("blogs (summary)", list[BlogSummaryOut], _blogs(count), number)
+        _measure("blogs (with content)", list[BlogOut], _blogs(count), number)
+        _measure("bookings", list[BookingOut], _bookings(count), number)
+        _measure("categories", list[CategoryOut], _categories(count), number)
+
+
+if __name__ == "__main__":
+    main()
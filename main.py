@@ -1,15 +1,29 @@
 import uvicorn
 
-from app.core.config import settings
+from app.core.config import production_server, settings, web_workers
 
 
 def main() -> None:
+    if not production_server():
+        uvicorn.run(
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            reload=settings.RELOAD,
+            reload_dirs=["app"] if settings.RELOAD else None,
+        )
+        return
     uvicorn.run(
         "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=settings.RELOAD,
-        reload_dirs=["app"] if settings.RELOAD else None,
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=web_workers(),
+        loop=settings.WEB_LOOP,
+        http=settings.WEB_HTTP,
+        backlog=settings.WEB_BACKLOG,
+        timeout_keep_alive=settings.WEB_KEEPALIVE_SECONDS,
+        limit_concurrency=settings.WEB_LIMIT_CONCURRENCY or None,
+        timeout_graceful_shutdown=settings.WEB_GRACEFUL_TIMEOUT_SECONDS,
     )
 
 
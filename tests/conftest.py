@@ -0,0 +1,11 @@
+import os
+
+for name, value in {
+    "DATABASE_URL": "sqlite+aiosqlite:///./test.db",
+    "JWT_SECRET": "test-secret",
+    "MAIL_USERNAME": "",
+    "MAIL_PASSWORD": "",
+    "MAIL_FROM": "noreply@example.com",
+    "MAIL_SERVER": "localhost",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,142 @@
+import asyncio
+import socket
+import threading
+from email.message import EmailMessage
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from app.services import mail_transport
+from app.services.mail_transport import SMTPPool
+
+
+class RecordingHandler:
+    def __init__(self, delay: float = 0) -> None:
+        self.delay = delay
+        self.peers: list[tuple[str, int]] = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    async def handle_DATA(self, server, session, envelope) -> str:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            self.peers.append(session.peer)
+        finally:
+            with self._lock:
+                self.active -= 1
+        return "250 OK"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_server():
+    def start(delay: float = 0, handler: RecordingHandler | None = None, port: int | None = None) -> Controller:
+        controller = Controller(handler or RecordingHandler(delay), hostname="127.0.0.1", port=port or _free_port())
+        controller.start()
+        controllers.append(controller)
+        return controller
+
+    controllers: list[Controller] = []
+    yield start
+    for controller in controllers:
+        if not controller.loop.is_closed():
+            controller.stop()
+
+
+def _pool(controller: Controller, size: int = 2, idle_seconds: float = 60) -> SMTPPool:
+    return SMTPPool(
+        hostname=controller.hostname,
+        port=controller.port,
+        username=None,
+        password=None,
+        use_tls=False,
+        start_tls=False,
+        size=size,
+        idle_seconds=idle_seconds,
+        timeout=5,
+    )
+
+
+def _message(index: int) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = "noreply@example.com"
+    message["To"] = f"user{index}@example.com"
+    message["Subject"] = f"Message {index}"
+    message.set_content("Hello")
+    return message
+
+
+def test_sequential_sends_reuse_one_connection(smtp_server):
+    controller = smtp_server()
+    pool = _pool(controller)
+
+    async def run() -> None:
+        for index in range(3):
+            await pool.send(_message(index))
+        await pool.close()
+
+    asyncio.run(run())
+    assert len(controller.handler.peers) == 3
+    assert len(set(controller.handler.peers)) == 1
+    assert pool.connects == 1
+    assert pool.reuses == 2
+
+
+def test_idle_connection_past_limit_is_replaced(smtp_server):
+    controller = smtp_server()
+    pool = _pool(controller, idle_seconds=0.05)
+
+    async def run() -> None:
+        await pool.send(_message(0))
+        await asyncio.sleep(0.1)
+        await pool.send(_message(1))
+        await pool.close()
+
+    asyncio.run(run())
+    assert len(set(controller.handler.peers)) == 2
+    assert pool.connects == 2
+    assert pool.discards >= 1
+
+
+def test_connection_dropped_by_server_is_reconnected(smtp_server, monkeypatch):
+    monkeypatch.setattr(mail_transport, "_HEALTH_CHECK_AFTER_SECONDS", 0)
+    controller = smtp_server()
+    pool = _pool(controller)
+
+    async def run() -> None:
+        await pool.send(_message(0))
+        await asyncio.to_thread(controller.stop)
+        await asyncio.to_thread(smtp_server, handler=controller.handler, port=controller.port)
+        await pool.send(_message(1))
+        await pool.close()
+
+    asyncio.run(run())
+    assert len(controller.handler.peers) == 2
+    assert pool.connects == 2
+    assert pool.discards >= 1
+
+
+def test_concurrent_sends_are_bounded_by_pool_size(smtp_server):
+    controller = smtp_server(delay=0.05)
+    pool = _pool(controller, size=2)
+
+    async def run() -> None:
+        await asyncio.gather(*(pool.send(_message(index)) for index in range(6)))
+        assert pool.stats()["idle"] <= 2
+        assert await pool.send_many([_message(index) for index in range(6)]) == [None] * 6
+        await pool.close()
+
+    asyncio.run(run())
+    assert len(controller.handler.peers) == 12
+    assert controller.handler.max_active <= 2
+    assert pool.connects <= 2
@@ -0,0 +1,119 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.config import settings
+from app.services import recaptcha_service
+
+RESET_SECONDS = 0.05
+
+
+class StandInVerifier:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.reply: httpx.Response | Exception = httpx.Response(200, json={"success": True})
+        self.block = False
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        if self.block:
+            await asyncio.Event().wait()
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        return self.reply
+
+
+@pytest.fixture
+def verifier(monkeypatch):
+    stand_in = StandInVerifier()
+    monkeypatch.setattr(settings, "RECAPTCHA_SECRET", "secret")
+    monkeypatch.setattr(settings, "RECAPTCHA_FAIL_OPEN", False)
+    monkeypatch.setattr(recaptcha_service, "breaker", CircuitBreaker(failure_threshold=2, reset_seconds=RESET_SECONDS))
+    monkeypatch.setattr(recaptcha_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(stand_in)))
+    return stand_in
+
+
+def _verify() -> int | None:
+    async def run() -> None:
+        await recaptcha_service.verify("token")
+
+    try:
+        asyncio.run(run())
+    except HTTPException as exc:
+        return exc.status_code
+    return None
+
+
+def test_breaker_opens_on_upstream_errors_and_closes_after_successful_probe(verifier):
+    verifier.reply = httpx.Response(502)
+    assert _verify() == 503
+    assert recaptcha_service.breaker.state == "closed"
+    assert _verify() == 503
+    assert recaptcha_service.breaker.state == "open"
+
+    verifier.reply = httpx.Response(200, json={"success": True})
+    assert _verify() == 503
+    assert verifier.calls == 2
+
+    asyncio.run(asyncio.sleep(RESET_SECONDS))
+    assert _verify() is None
+    assert verifier.calls == 3
+    assert recaptcha_service.breaker.state == "closed"
+
+
+def test_failed_probe_reopens_breaker(verifier):
+    verifier.reply = httpx.ConnectError("refused")
+    _verify()
+    _verify()
+    asyncio.run(asyncio.sleep(RESET_SECONDS))
+    assert _verify() == 503
+    assert verifier.calls == 3
+    assert recaptcha_service.breaker.state == "open"
+
+
+def test_cancelled_probe_releases_half_open_breaker(verifier):
+    verifier.reply = httpx.Response(503)
+    _verify()
+    _verify()
+    asyncio.run(asyncio.sleep(RESET_SECONDS))
+
+    async def cancelled_probe() -> None:
+        verifier.block = True
+        task = asyncio.create_task(recaptcha_service.verify("token"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancelled_probe())
+    verifier.block = False
+    verifier.reply = httpx.Response(200, json={"success": True})
+    assert _verify() is None
+    assert recaptcha_service.breaker.state == "closed"
+
+
+def test_client_errors_do_not_trip_breaker(verifier):
+    verifier.reply = httpx.Response(400)
+    for _ in range(3):
+        assert _verify() == 503
+    assert recaptcha_service.breaker.state == "closed"
+    assert verifier.calls == 3
+
+
+def test_fail_closed_and_fail_open(verifier, monkeypatch):
+    verifier.reply = httpx.ReadTimeout("slow")
+    assert _verify() == 503
+    monkeypatch.setattr(settings, "RECAPTCHA_FAIL_OPEN", True)
+    assert _verify() is None
+    assert recaptcha_service.breaker.state == "open"
+    assert _verify() is None
+    assert verifier.calls == 2
+
+
+def test_rejected_token_is_a_bad_request(verifier):
+    verifier.reply = httpx.Response(200, json={"success": False})
+    assert _verify() == 400
+    assert recaptcha_service.breaker.state == "closed"
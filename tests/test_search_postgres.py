@@ -0,0 +1,73 @@
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import psycopg
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.cache import public_cache
+from app.db.base import Base
+from app.db.models.blog import Blog
+from app.db.models.category import Category
+from app.db.models.user import User
+from app.schemas.blog import BlogCreate, BlogUpdate
+from app.services import blog_service, search_service
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+def test_search_vector_passes_weights_as_char():
+    vector = search_service.search_vector("postgresql", "Pruning roses", "<p>Cut above a bud.</p>")
+    sql = str(update(Blog).values(search_vector=vector).compile(dialect=psycopg.dialect()))
+    assert "'A'::\"char\"" in sql
+    assert "'B'::\"char\"" in sql
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+def test_blogs_are_searchable_after_create_and_update_on_postgres():
+    async def search(db, query: str) -> list:
+        return [blog.id for blog in await blog_service.search_published_blogs(db, query)]
+
+    async def run() -> None:
+        engine = create_async_engine(POSTGRES_URL)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+        public_cache.clear()
+        try:
+            async with session_factory() as db:
+                author = User(email="author@example.com", password_hash="x", role="ADMIN")
+                category = Category(name="Gardening")
+                db.add_all([author, category])
+                await db.commit()
+
+                def payload(title: str, content_html: str) -> BlogCreate:
+                    return BlogCreate(
+                        title=title,
+                        content_html=content_html,
+                        category_id=category.id,
+                        status="PUBLISHED",
+                        image_url="https://example.com/cover.png",
+                    )
+
+                roses = await blog_service.create_blog(
+                    db, author.id, payload("Pruning roses", "<p>Cut <b>above</b> an outward bud.</p>")
+                )
+                mulch = await blog_service.create_blog(
+                    db, author.id, payload("Mulching beds", "<p>Mulch keeps roses and shrubs moist.</p>")
+                )
+                assert await search(db, "roses") == [roses.id, mulch.id]
+                assert await search(db, "outward buds") == [roses.id]
+
+                await blog_service.update_blog(db, roses, BlogUpdate(title="Planting tulips"))
+                assert await search(db, "tulips") == [roses.id]
+                assert await search(db, "roses") == [mulch.id]
+        finally:
+            public_cache.clear()
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+            await engine.dispose()
+
+    asyncio.run(run())
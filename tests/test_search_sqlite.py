@@ -0,0 +1,86 @@
+import asyncio
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.cache import public_cache
+from app.core.config import settings
+from app.db.base import Base
+from app.db.models.blog import Blog
+from app.db.models.category import Category
+from app.db.models.user import User
+from app.schemas.blog import BlogCreate, BlogUpdate
+from app.services import blog_service, search_service
+
+
+def test_blogs_are_searchable_through_the_inverted_index_on_sqlite(tmp_path, monkeypatch):
+    monkeypatch.setattr(search_service, "inverted_index", search_service.InvertedIndex())
+
+    async def search(db, query: str) -> list:
+        return [blog.id for blog in await blog_service.search_published_blogs(db, query)]
+
+    async def run() -> None:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'search.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+        public_cache.clear()
+        try:
+            async with session_factory() as db:
+                author = User(email="author@example.com", password_hash="x", role="ADMIN")
+                category = Category(name="Gardening")
+                db.add_all([author, category])
+                await db.commit()
+
+                def payload(title: str, content_html: str) -> BlogCreate:
+                    return BlogCreate(
+                        title=title,
+                        content_html=content_html,
+                        category_id=category.id,
+                        status="PUBLISHED",
+                        image_url="https://example.com/cover.png",
+                    )
+
+                roses = await blog_service.create_blog(
+                    db, author.id, payload("Pruning roses", "<p>Cut <b>above</b> an outward bud.</p>")
+                )
+                mulch = await blog_service.create_blog(
+                    db, author.id, payload("Mulching beds", "<p>Mulch keeps roses and shrubs moist.</p>")
+                )
+                assert await search(db, "roses") == [roses.id, mulch.id]
+                assert await search(db, "outward bud") == [roses.id]
+                assert await search(db, "roses shrubs") == [mulch.id]
+
+                await blog_service.update_blog(db, roses, BlogUpdate(title="Planting tulips"))
+                assert await search(db, "tulips") == [roses.id]
+                assert await search(db, "roses") == [mulch.id]
+
+                await blog_service.update_blog(db, roses, BlogUpdate(status="DRAFT"))
+                assert await search(db, "tulips") == []
+
+                await blog_service.delete_blog(db, mulch)
+                assert await search(db, "roses") == []
+
+            async with session_factory() as other:
+                ferns = Blog(
+                    title="Watering ferns",
+                    content_html="<p>Keep ferns damp.</p>",
+                    search_vector="Watering ferns\nKeep ferns damp.",
+                    status="PUBLISHED",
+                    published_at=datetime.now(timezone.utc),
+                    category_id=category.id,
+                    author_id=author.id,
+                )
+                other.add(ferns)
+                await other.commit()
+
+            async with session_factory() as db:
+                assert await search(db, "ferns") == []
+                search_service.inverted_index._built_at -= settings.PUBLIC_CACHE_TTL_SECONDS
+                public_cache.clear()
+                assert await search(db, "ferns") == [ferns.id]
+        finally:
+            public_cache.clear()
+            await engine.dispose()
+
+    asyncio.run(run())